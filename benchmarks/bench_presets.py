@@ -0,0 +1,69 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from presetformat import BINARY_EXTENSION, encodePreset, readBinaryPreset
+from bench_ticks import buildConfig
+from timer import validateConfigDict
+
+import tempfile
+import argparse
+import time
+import json
+
+TIMER_COUNTS = [4, 50, 500, 5000]
+
+def loadJson(path: str) -> dict:
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    if not validateConfigDict(data):
+        raise ValueError("Benchmark preset failed validation.")
+
+    return data
+
+
+def timeLoad(load, path: str, repeats: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load(path)
+        best = min(best, time.perf_counter() - start)
+
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load time of JSON presets (parse and validate) against binary presets.")
+    parser.add_argument("--timers", type=int, nargs="+", default=TIMER_COUNTS, help="timer counts to measure")
+    parser.add_argument("--repeats", type=int, default=20, help="loads per case, the fastest one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        for timer_count in args.timers:
+            config = buildConfig(timer_count, True)
+
+            json_path = os.path.join(folder, f"preset_{timer_count}.json")
+            binary_path = os.path.join(folder, f"preset_{timer_count}{BINARY_EXTENSION}")
+
+            with open(json_path, "w") as f:
+                json.dump(config, f, indent=4)
+
+            with open(binary_path, "wb") as f:
+                f.write(encodePreset(config))
+
+            if readBinaryPreset(binary_path) != config:
+                print(f"Round trip mismatch with {timer_count} timers")
+                return 1
+
+            json_ms = timeLoad(loadJson, json_path, args.repeats)
+            binary_ms = timeLoad(readBinaryPreset, binary_path, args.repeats)
+
+            print(f"{timer_count:>6} timers  json {json_ms:9.3f} ms ({os.path.getsize(json_path):>9} B)  binary {binary_ms:9.3f} ms ({os.path.getsize(binary_path):>9} B)  {json_ms / binary_ms:5.1f}x")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
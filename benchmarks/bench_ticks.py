@@ -0,0 +1,228 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import NS_PER_MS, DEFAULT_FRAME_RATE
+from tickstats import percentile
+from timerengine import TimerEngine
+from timer import TimerView, RENDERERS
+
+import customtkinter as ctk
+import platform
+import argparse
+import random
+import time
+import json
+
+TIMER_COUNTS = [4, 50, 500, 5000]
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+def buildConfig(timer_count: int, with_changes: bool, seed: int = 0, renderer: str = "labels") -> dict:
+    rng = random.Random(seed)
+    global_frames = 32100
+
+    timers = []
+    for index in range(timer_count):
+        changes = []
+
+        if with_changes:
+            for trigger in sorted(rng.sample(range(1, global_frames), 4), reverse=True):
+                changes.append({
+                    "trigger_frame": trigger,
+                    "change_to": rng.randint(150, 400),
+                    "overwrite": rng.random() < 0.5
+                })
+
+        timers.append({
+            "title": f"Timer {index}",
+            "color": "#ffffff",
+            "frames": rng.randint(150, 400),
+            "visible": True,
+            "changes": changes
+        })
+
+    return {
+        "window_settings": {
+            "bg_color": "#000000",
+            "always_on_top": False,
+            "global_hotkeys": False,
+            "stats_path": "",
+            "renderer": renderer
+        },
+        "binds": {
+            "startstop": "`",
+            "restart": "="
+        },
+        "global_timer": {
+            "color": "#ffffff",
+            "frames": global_frames
+        },
+        "timers": timers
+    }
+
+
+def summarize(target: str, timer_count: int, with_changes: bool, frames: int, samples: list[int]) -> dict:
+    samples.sort()
+    budget_ms = 1000 / DEFAULT_FRAME_RATE
+    mean_ms = sum(samples) / len(samples) / NS_PER_MS
+
+    return {
+        "target": target,
+        "timers": timer_count,
+        "changes": with_changes,
+        "frames": frames,
+        "mean_ms": mean_ms,
+        "p50_ms": percentile(samples, 50) / NS_PER_MS,
+        "p99_ms": percentile(samples, 99) / NS_PER_MS,
+        "max_ms": samples[-1] / NS_PER_MS,
+        "headroom_ms": budget_ms - mean_ms,
+        "headroom_pct": (budget_ms - mean_ms) / budget_ms * 100
+    }
+
+
+def benchView(root: ctk.CTk, timer_count: int, with_changes: bool, frames: int, renderer: str) -> dict:
+    view = TimerView(root, font="Helvetica", config_data=buildConfig(timer_count, with_changes, renderer=renderer))
+    view.createWindow()
+    view.update()
+
+    view.engine.resume()
+    samples = []
+
+    for _ in range(frames):
+        start = time.process_time_ns()
+
+        view._applyFrames([0])
+        view.update_idletasks()
+
+        samples.append(time.process_time_ns() - start)
+
+    view.destroyWindow()
+    root.update()
+
+    return summarize(f"view-{renderer}", timer_count, with_changes, frames, samples)
+
+
+def benchEngine(timer_count: int, with_changes: bool, frames: int) -> dict:
+    config = buildConfig(timer_count, with_changes)
+    engine = TimerEngine(config["global_timer"], config["timers"])
+
+    engine.resume()
+    samples = []
+
+    for _ in range(frames):
+        start = time.process_time_ns()
+        engine.step()
+        samples.append(time.process_time_ns() - start)
+
+    return summarize("engine", timer_count, with_changes, frames, samples)
+
+
+def caseKey(result: dict) -> tuple:
+    return (result["target"], result["timers"], result["changes"])
+
+
+def compareResults(results: list[dict], baseline: dict, threshold: float, min_delta_ms: float, allow_missing: bool) -> bool:
+    previous = {caseKey(result): result for result in baseline["results"]}
+    ok = True
+
+    for result in results:
+        old = previous.get(caseKey(result))
+
+        if old is None:
+            if allow_missing:
+                print(f"{result['target']:<12} {result['timers']:>6} timers, changes={str(result['changes']):<5} no baseline, skipped")
+                continue
+
+            print(f"{result['target']:<12} {result['timers']:>6} timers, changes={str(result['changes']):<5} MISSING from baseline")
+            ok = False
+            continue
+
+        ratio = result["mean_ms"] / old["mean_ms"] if old["mean_ms"] else 1
+        status = "ok"
+
+        # tiny cases are dominated by timer noise, so a regression has to be slower in absolute terms too
+        if ratio > 1 + threshold and result["mean_ms"] - old["mean_ms"] > min_delta_ms:
+            status = "REGRESSION"
+            ok = False
+
+        print(f"{result['target']:<12} {result['timers']:>6} timers, changes={str(result['changes']):<5} {old['mean_ms']:9.4f} ms -> {result['mean_ms']:9.4f} ms ({ratio:5.2f}x) {status}")
+
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-tick cost of TimerView as the timer count grows.")
+    parser.add_argument("--frames", type=int, default=2000, help="frames measured per case")
+    parser.add_argument("--timers", type=int, nargs="+", default=TIMER_COUNTS, help="timer counts to measure")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write results to {BASELINE_PATH}")
+    parser.add_argument("--compare", action="store_true", help="compare results against the saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before a case counts as a regression")
+    parser.add_argument("--min-delta", type=float, default=0.01, help="smallest slowdown in ms per frame that counts as a regression")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--renderers", nargs="+", choices=RENDERERS, default=list(RENDERERS), help="render backends to measure")
+    parser.add_argument("--engine-only", action="store_true", help="only measure TimerEngine.step, no display needed")
+    args = parser.parse_args()
+
+    root = None
+
+    if not args.engine_only:
+        if platform.system() == "Linux" and not os.environ.get("DISPLAY"):
+            print("No display found, run the benchmark under a virtual X server: xvfb-run -a python benchmarks/bench_ticks.py")
+            return 2
+
+        root = ctk.CTk()
+        root.withdraw()
+
+    budget_ms = 1000 / DEFAULT_FRAME_RATE
+    results = []
+
+    print(f"Frame budget: {budget_ms:.2f} ms")
+
+    for timer_count in args.timers:
+        for with_changes in (False, True):
+            cases = [benchEngine(timer_count, with_changes, args.frames)]
+
+            if not root is None:
+                for renderer in args.renderers:
+                    cases.append(benchView(root, timer_count, with_changes, args.frames, renderer))
+
+            for result in cases:
+                results.append(result)
+                print(f"{result['target']:<12} {timer_count:>6} timers, changes={str(with_changes):<5} mean {result['mean_ms']:8.4f} ms  p99 {result['p99_ms']:8.4f} ms  headroom {result['headroom_ms']:8.3f} ms ({result['headroom_pct']:6.1f}%)")
+
+    if not root is None:
+        root.destroy()
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "frame_budget_ms": budget_ms,
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(report, f, indent=4)
+
+        print(f"Baseline saved to {BASELINE_PATH}")
+
+    if args.compare:
+        if not os.path.exists(BASELINE_PATH):
+            print(f"No baseline at {BASELINE_PATH}, run with --save-baseline first.")
+            return 2
+
+        with open(BASELINE_PATH, "r") as f:
+            baseline = json.load(f)
+
+        if not compareResults(results, baseline, args.threshold, args.min_delta, args.engine_only):
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timer import TimerView, readConfigFile
+from PIL import ImageGrab, ImageChops
+
+import customtkinter as ctk
+import platform
+import argparse
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def grabWindow(view: TimerView):
+    view.update()
+
+    x, y = view.winfo_rootx(), view.winfo_rooty()
+    width, height = view.winfo_width(), view.winfo_height()
+
+    return ImageGrab.grab(bbox=(x, y, x + width, y + height)).convert("RGB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Render a preset with every backend and compare the result to the label renderer.")
+    parser.add_argument("--preset", default=os.path.join(REPO_ROOT, "assets/saves/fnaf1.json"))
+    parser.add_argument("--font", default="Helvetica")
+    parser.add_argument("--frames", type=int, default=120, help="frames to advance before the screenshot")
+    parser.add_argument("--threshold", type=float, default=0.01, help="allowed fraction of differing pixels")
+    parser.add_argument("--output", default=os.path.join(REPO_ROOT, "benchmarks/renderers"), help="folder for the screenshots")
+    args = parser.parse_args()
+
+    if platform.system() == "Linux" and not os.environ.get("DISPLAY"):
+        print("No display found, run the comparison under a virtual X server: xvfb-run -a python benchmarks/compare_renderers.py")
+        return 2
+
+    config = readConfigFile(args.preset)
+
+    if config is None:
+        return 2
+
+    config["window_settings"]["global_hotkeys"] = False
+    config["window_settings"]["always_on_top"] = False
+    config["window_settings"]["stats_path"] = ""
+
+    os.makedirs(args.output, exist_ok=True)
+
+    root = ctk.CTk()
+    root.withdraw()
+
+    images = {}
+
+    for index, renderer in enumerate(["labels", "canvas"]):
+        config["window_settings"]["renderer"] = renderer
+
+        view = TimerView(root, font=args.font, config_data=config)
+        view.createWindow()
+        view.geometry(f"+{50 + index * 250}+50")
+
+        view.engine.resume()
+        view._applyFrames([0] * args.frames)
+
+        images[renderer] = grabWindow(view)
+        images[renderer].save(os.path.join(args.output, f"{renderer}.png"))
+
+        view.destroyWindow()
+
+    root.destroy()
+
+    reference, candidate = images["labels"], images["canvas"]
+
+    if reference.size != candidate.size:
+        print(f"Window sizes differ: labels {reference.size}, canvas {candidate.size}")
+        return 1
+
+    difference = ImageChops.difference(reference, candidate).convert("L")
+    changed = sum(difference.point(lambda value: 255 if value > 32 else 0).histogram()[255:])
+    ratio = changed / (reference.width * reference.height)
+
+    print(f"Differing pixels: {changed} ({ratio:.2%}), screenshots saved to {args.output}")
+
+    return 0 if ratio <= args.threshold else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,12 @@ from typing import Callable, Optional, Any
 import customtkinter as ctk
 
 class BindButton(ctk.CTkButton):
-    def __init__(self, parent, default_button: str = "`", **kwargs) -> None:
+    def __init__(self, parent, default_button: str = "`", on_change: Optional[Callable] = None, **kwargs) -> None:
         super().__init__(parent, text=default_button.title(), command=self.startListening, **kwargs)
         self.allowed_keys = "`1234567890-=qwertyuiop[]\\asdfghjkl;'zxcvbnm,./"
         self.button = default_button
         self.islistening = False
+        self.on_change = on_change
 
     def startListening(self) -> None:
         self.islistening = True
@@ -29,6 +30,9 @@ class BindButton(ctk.CTkButton):
         self.configure(text=key_char)
         self.button = key_char
 
+        if not self.on_change is None:
+            self.on_change()
+
     def reset(self) -> None:
         self.islistening = False
         self.unbind("<Key>")
@@ -0,0 +1,117 @@
+from scheduler import FrameScheduler, NS_PER_MS, NS_PER_SECOND, MAX_TOLERANCE
+from typing import Optional, Callable
+from threading import Thread
+from statistics import median
+
+import time
+
+class Calibrator:
+    DELAYS_MS = (1, 2, 4, 8, 16)
+
+    def __init__(self, master, frame_rate: int | float, duration: float = 3.0, callback: Optional[Callable] = None) -> None:
+        self.master = master
+        self.frame_rate = frame_rate
+        self.phase_ns = round(duration * NS_PER_SECOND / 2)
+        self.callback = callback
+
+        self.after_samples = []
+        self.sleep_samples = []
+        self.sleep_thread = None
+        self.scheduler = None
+
+        self.tick_times = []
+        self.phase_end = 0
+        self.requested = 0
+        self.requested_at = 0
+
+    def start(self) -> None:
+        print("Calibrating timer, please wait...")
+
+        self.sleep_thread = Thread(target=self._measureSleep, daemon=True)
+        self.sleep_thread.start()
+
+        self.phase_end = time.perf_counter_ns() + self.phase_ns
+        self._measureAfter()
+
+    def _measureSleep(self) -> None:
+        end = time.perf_counter_ns() + self.phase_ns
+        index = 0
+
+        while time.perf_counter_ns() < end:
+            delay = self.DELAYS_MS[index % len(self.DELAYS_MS)]
+            index += 1
+
+            start = time.perf_counter_ns()
+            time.sleep(delay / 1000)
+            self.sleep_samples.append(time.perf_counter_ns() - start - delay * NS_PER_MS)
+
+    def _measureAfter(self) -> None:
+        now = time.perf_counter_ns()
+
+        if self.requested_at:
+            self.after_samples.append(now - self.requested_at - self.requested * NS_PER_MS)
+
+        if now >= self.phase_end:
+            self._startVerification()
+            return
+
+        self.requested = self.DELAYS_MS[len(self.after_samples) % len(self.DELAYS_MS)]
+        self.requested_at = time.perf_counter_ns()
+        self.master.after(self.requested, self._measureAfter)
+
+    def _startVerification(self) -> None:
+        self.scheduler = FrameScheduler(self.frame_rate, self.tolerance())
+        self.scheduler.start()
+        self.phase_end = self.scheduler.start_ns + self.phase_ns
+        self._verifyTick()
+
+    def _verifyTick(self) -> None:
+        scheduler = self.scheduler
+        now = time.perf_counter_ns()
+
+        if now >= self.phase_end:
+            self._finish()
+            return
+
+        if scheduler.isDue(now):
+            scheduler.markTick(now)
+            self.tick_times.append(now)
+
+        self.master.after(scheduler.nextDelay(time.perf_counter_ns()), self._verifyTick)
+
+    def tolerance(self) -> float:
+        if not self.after_samples:
+            return 0.0
+
+        return min(max(0, median(self.after_samples)) / NS_PER_SECOND, MAX_TOLERANCE)
+
+    def sleepTolerance(self) -> float:
+        if not self.sleep_samples:
+            return 0.0
+
+        return min(max(0, median(self.sleep_samples)) / NS_PER_SECOND, MAX_TOLERANCE)
+
+    def achievedFps(self) -> float:
+        if len(self.tick_times) < 2:
+            return 0.0
+
+        elapsed = (self.tick_times[-1] - self.tick_times[0]) / NS_PER_SECOND
+
+        return (len(self.tick_times) - 1) / elapsed
+
+    def _finish(self) -> None:
+        self.sleep_thread.join()
+
+        result = {
+            "tolerance": self.tolerance(),
+            "sleep_tolerance": self.sleepTolerance()
+        }
+
+        target_fps = self.frame_rate
+        fps = self.achievedFps()
+
+        print(f"Calibration done: after() overshoot {result['tolerance'] * 1000:.3f} ms, sleep overshoot {result['sleep_tolerance'] * 1000:.3f} ms")
+        print(f"Achieved {fps:.4f} fps (target {target_fps:.4f} fps, error {fps - target_fps:+.4f} fps)")
+
+        if not self.callback is None:
+            self.callback(result)
@@ -1,6 +1,7 @@
 from typing import Optional, Callable, Any
 from colorpicker import ColorEntry
-from PIL import Image
+from imagecache import getImage
+from widgetpool import WidgetPool
 
 import customtkinter as ctk
 
@@ -19,7 +20,7 @@ class ChangeBlock(ctk.CTkFrame):
 
         font13 = (font[0], 13)
 
-        X_image = ctk.CTkImage(light_image=Image.open("assets/images/X.png"), size=(30, 30))
+        X_image = getImage("assets/images/X.png", (30, 30))
 
         remove_button = ctk.CTkButton(self, text="", image=X_image, width=30, height=30, fg_color="#3b3b3b", hover_color="#262626", corner_radius=5, command=self.remove)
         remove_button.place(x=10, rely=0.5, anchor="w")
@@ -50,8 +51,6 @@ class ChangeBlock(ctk.CTkFrame):
 
     def remove(self) -> None:
         self.remove_func(self.id)
-        self.pack_forget()
-        self.destroy()
 
     def getData(self) -> dict:
         trigger_frame = self.data["trigger_frame"]
@@ -79,6 +78,8 @@ class ChangeBlock(ctk.CTkFrame):
 
         if data["overwrite"]:
             self.overwrite_checkbox.select()
+        else:
+            self.overwrite_checkbox.deselect()
 
         self.trigger_frame_entry.delete(0, 'end')
         self.change_to_entry.delete(0, 'end')
@@ -97,6 +98,7 @@ class ChangeScrollableFrame(ctk.CTkScrollableFrame):
         self.height = height
 
         self.changes = []
+        self.block_pool = WidgetPool(lambda: ChangeBlock(self, self.font, 0, self.removeChange, self.width-10, 50))
 
         self.add_button = ctk.CTkButton(self, width=width-10, height=40, text="Add Change", font=self.font, fg_color="#1ac779", hover_color="#138a54", text_color="#000000", corner_radius=5, command=self.addChange)
         self.add_button.pack(pady=5, padx=5)
@@ -105,14 +107,23 @@ class ChangeScrollableFrame(ctk.CTkScrollableFrame):
 
 
     def addChange(self) -> None:
-        change = ChangeBlock(self, self.font, len(self.changes), self.removeChange, self.width-10, 50)
-        
+        self.appendChange({
+            "trigger_frame": 100,
+            "change_to": 1000,
+            "overwrite": False
+        })
+
+    def appendChange(self, data: dict) -> None:
+        change = self.block_pool.acquire()
+
+        change.id = len(self.changes)
+        change.setData(data)
         change.pack(pady=5)
 
         self.changes.append(change)
 
     def removeChange(self, id) -> None:
-        self.changes.pop(id)
+        self.block_pool.release(self.changes.pop(id))
 
         for index, change in enumerate(self.changes):
             change.id = index
@@ -126,11 +137,12 @@ class ChangeScrollableFrame(ctk.CTkScrollableFrame):
         return data
     
     def setChanges(self, data: list[dict]) -> None:
-        for index, item in enumerate(data):
-            change = ChangeBlock(self, self.font, index, self.removeChange, self.width-10, 50)
+        while len(self.changes) > len(data):
+            self.block_pool.release(self.changes.pop())
 
-            change.setData(item)
-
-            change.pack(pady=5)
+        for index, item in enumerate(data):
+            if index < len(self.changes):
+                self.changes[index].setData(item)
+                continue
 
-            self.changes.append(change)
\ No newline at end of file
+            self.appendChange(item)
\ No newline at end of file
@@ -1,14 +1,97 @@
+from diskcache import CACHE_DIR, getCachePath
 from typing import Callable, Optional
-from PIL import Image, ImageDraw
 
 import customtkinter as ctk
-import colorsys
+import os
 import re
 
+GRADIENT_RGB_FILE = "gradient_rgb_v1.png"
+GRADIENT_BW_FILE = "gradient_bw_v1.png"
+MOTION_INTERVAL_MS = 16
+
+_gradient_images = None
+_gradient_photos = None
+
+def generateGradientImages() -> tuple:
+    from PIL import Image
+    import numpy as np
+    import colorsys
+
+    width, height = 256, 256
+
+    hue = np.arange(width) / width
+    saturation = 1 - (np.arange(height) / height)
+
+    # same float operations as colorsys.hls_to_rgb with a lightness of 0.5
+    m2 = (0.5 * (1.0 + saturation))[:, None]
+    m1 = 2.0 * 0.5 - m2
+
+    def channel(channel_hue):
+        channel_hue = np.mod(channel_hue, 1.0)[None, :]
+
+        return np.select(
+            [channel_hue < colorsys.ONE_SIXTH, channel_hue < 0.5, channel_hue < colorsys.TWO_THIRD],
+            [m1 + (m2 - m1) * channel_hue * 6.0, np.broadcast_to(m2, (height, width)), m1 + (m2 - m1) * (colorsys.TWO_THIRD - channel_hue) * 6.0],
+            np.broadcast_to(m1, (height, width))
+        )
+
+    rgb = np.stack([channel(hue + colorsys.ONE_THIRD), channel(hue), channel(hue - colorsys.ONE_THIRD)], axis=-1)
+    imagergb = Image.fromarray((rgb * 255).astype(np.uint8), "RGB")
+
+    gray = np.minimum(height - np.arange(height + 1), 255).astype(np.uint8)
+    imagebw = Image.fromarray(np.repeat(np.broadcast_to(gray[:, None, None], (height + 1, 40, 1)), 3, axis=2), "RGB")
+
+    return imagergb, imagebw
+
+
+def getGradientImages() -> tuple:
+    global _gradient_images
+
+    if not _gradient_images is None:
+        return _gradient_images
+
+    from PIL import Image
+
+    rgb_path, bw_path = getCachePath(GRADIENT_RGB_FILE), getCachePath(GRADIENT_BW_FILE)
+
+    try:
+        imagergb = Image.open(rgb_path).convert("RGB")
+        imagebw = Image.open(bw_path).convert("RGB")
+
+    except Exception:
+        imagergb, imagebw = generateGradientImages()
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            imagergb.save(rgb_path)
+            imagebw.save(bw_path)
+        except Exception as e:
+            print(f"Failed to cache gradient images: {e}")
+
+    _gradient_images = (imagergb, imagebw)
+
+    return _gradient_images
+
+
+def getGradientPhotos() -> tuple:
+    global _gradient_photos
+
+    if _gradient_photos is None:
+        imagergb, imagebw = getGradientImages()
+
+        _gradient_photos = (
+            ctk.CTkImage(light_image=imagergb, size=(256, 256)),
+            ctk.CTkImage(light_image=imagebw, size=(40, 256))
+        )
+
+    return _gradient_photos
+
+
 class ColorEntry(ctk.CTkEntry):
-    def __init__(self, parent: ctk.CTk, height: int, width: int, font: tuple, default_color: str = "#ffffff", **kwargs) -> None:
+    def __init__(self, parent: ctk.CTk, height: int, width: int, font: tuple, default_color: str = "#ffffff", on_change: Optional[Callable] = None, **kwargs) -> None:
         super().__init__(parent, placeholder_text="HEX Color", width=width, height=height, font=font, **kwargs)
         self.font = font
+        self.on_change = on_change
 
         self.current = default_color
         self.insert(0, default_color)
@@ -41,6 +124,9 @@ class ColorEntry(ctk.CTkEntry):
         self.master.focus_set()
         self.current = hex
 
+        if not self.on_change is None:
+            self.on_change()
+
     def getColor(self) -> list[tuple, str]:
         hex_color = self.get()
 
@@ -57,6 +143,8 @@ class ColorPicker(ctk.CTkToplevel):
         self.args = args
         self.kwargs = kwargs
         self.button1_down = False
+        self.pending_pointer = None
+        self.motion_job = None
 
         self.WIDTH = 400
         self.HEIGHT = 400
@@ -73,9 +161,9 @@ class ColorPicker(ctk.CTkToplevel):
         self.title(title)
         self.resizable(False, False)
 
-        self.imagergb, self.imagebw = self.generateGradientImage()
-        self.photorgb = ctk.CTkImage(light_image=self.imagergb, size=(256, 256))
-        self.photobw = ctk.CTkImage(light_image=self.imagebw, size=(40, 256))
+        self.imagergb, self.imagebw = getGradientImages()
+        self.photorgb, self.photobw = getGradientPhotos()
+        self.pixels = [self.imagergb.load(), self.imagebw.load()]
 
         self.holder = ctk.CTkFrame(self, width=self.WIDTH-40, height=270, fg_color="#363636")
         self.holder.place(rely=0.4, relx=0.5, anchor="center")
@@ -120,63 +208,53 @@ class ColorPicker(ctk.CTkToplevel):
     def cancel(self) -> None:
         self.destroy()
 
-    def generateGradientImage(self) -> list:
-        width, height = 256, 256
-        imagergb = Image.new("RGB", (width, height), "#000000")
-        imagebw = Image.new("RGB", (40, height+1), "#000000")
-        drawrgb = ImageDraw.Draw(imagergb)
-        drawbw = ImageDraw.Draw(imagebw)
-        
-        for x in range(width+1):
-            for y in range(height+1):
-                hue = x / width
-
-                saturation = 1 - (y / height)
-
-                lightness = 0.5
-
-                r, g, b = colorsys.hls_to_rgb(hue, lightness, saturation)
-                
-                r = int(r * 255)
-                g = int(g * 255)
-                b = int(b * 255)
+    def destroy(self) -> None:
+        self._cancelMotion()
+        super().destroy()
 
-                drawrgb.point((x, y), fill=(r, g, b))
+    def _cancelMotion(self) -> None:
+        if not self.motion_job is None:
+            self.after_cancel(self.motion_job)
+            self.motion_job = None
 
-        width = 40
+        self.pending_pointer = None
 
-        for x in range(width+1):
-            for y in range(height+1):
-                drawbw.point((x, height - y), fill=(y, y, y))
-        
-        return imagergb, imagebw
-    
     def mouse1ButtonDown(self, event, id: int) -> None:
         self.button1_down = True
+        self._cancelMotion()
 
         self.bringPointer(event.x, event.y, id)
 
     def mouse1ButtonUp(self, event) -> None:
         self.button1_down = False
+        self._flushPointer()
     
     def mouseMotion(self, event, id: int) -> None:
-        if self.button1_down:
-            self.bringPointer(event.x, event.y, id)
+        if not self.button1_down:
+            return
+
+        self.pending_pointer = (event.x, event.y, id)
+
+        if self.motion_job is None:
+            self.motion_job = self.after(MOTION_INTERVAL_MS, self._flushPointer)
 
+    def _flushPointer(self) -> None:
+        pointer = self.pending_pointer
+        self._cancelMotion()
+
+        if not pointer is None:
+            self.bringPointer(*pointer)
 
     def bringPointer(self, x: int, y: int, id: int) -> None:
-        bounds = {
-            0: (0, 255, 0, 255),
-            1: (0, 40, 0, 256)
-        }
+        image = [self.imagergb, self.imagebw][id]
 
-        x_min, x_max, y_min, y_max = bounds[id]
-        if x < x_min or x > x_max or y < y_min or y > y_max:
+        if x < 0 or x >= image.width or y < 0 or y >= image.height:
             return
-            
-        image = [self.imagergb, self.imagebw][id]
 
-        rgb = image.getpixel((x, y))
+        rgb = self.pixels[id][x, y]
+
+        if rgb == self.selected_color[0]:
+            return
 
         self.updateColor(rgb)
 
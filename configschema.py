@@ -0,0 +1,165 @@
+from scheduler import MAX_TOLERANCE
+from typing import Callable, NamedTuple, Any
+
+import math
+import re
+
+RENDERERS = ("labels", "canvas")
+
+HEX_COLOR = re.compile(r"#[0-9a-fA-F]{6}")
+
+class ConfigError(NamedTuple):
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+def isNumber(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+SCALAR_TYPES = {
+    "bool": (lambda value: isinstance(value, bool), "expected a boolean"),
+    "int": (lambda value: isinstance(value, int) and not isinstance(value, bool), "expected an integer"),
+    "number": (isNumber, "expected a number"),
+    "string": (lambda value: isinstance(value, str), "expected a string"),
+    "color": (lambda value: isinstance(value, str) and not HEX_COLOR.fullmatch(value) is None, "expected a color like '#ffffff'")
+}
+
+def compileNode(node: dict) -> Callable[[Any, str, list], None]:
+    kind = node["type"]
+
+    if kind == "object":
+        fields = [(key, f".{key}", child.get("required", True), compileNode(child)) for key, child in node["fields"].items()]
+
+        def validateObject(value: Any, path: str, errors: list) -> None:
+            if not isinstance(value, dict):
+                errors.append(ConfigError(path, "expected an object"))
+                return
+
+            for key, suffix, required, validate in fields:
+                if key in value:
+                    validate(value[key], path + suffix, errors)
+                elif required:
+                    errors.append(ConfigError(path + suffix, "missing required key"))
+
+        return validateObject
+
+    if kind == "array":
+        validateItem = compileNode(node["items"])
+
+        def validateArray(value: Any, path: str, errors: list) -> None:
+            if not isinstance(value, list):
+                errors.append(ConfigError(path, "expected an array"))
+                return
+
+            for index, item in enumerate(value):
+                validateItem(item, f"{path}[{index}]", errors)
+
+        return validateArray
+
+    if kind == "enum":
+        choices = node["choices"]
+        message = f"expected one of {choices}"
+
+        def validateEnum(value: Any, path: str, errors: list) -> None:
+            if not value in choices:
+                errors.append(ConfigError(path, message))
+
+        return validateEnum
+
+    isType, type_message = SCALAR_TYPES[kind]
+    checks = []
+
+    if node.get("finite", False):
+        checks.append((math.isfinite, "has to be finite"))
+
+    if "minimum" in node:
+        minimum = node["minimum"]
+        checks.append((lambda value: value >= minimum, f"has to be at least {minimum}"))
+
+    if "exclusive_minimum" in node:
+        exclusive_minimum = node["exclusive_minimum"]
+        checks.append((lambda value: value > exclusive_minimum, f"has to be higher than {exclusive_minimum}"))
+
+    if "maximum" in node:
+        maximum = node["maximum"]
+        checks.append((lambda value: value <= maximum, f"has to be at most {maximum}"))
+
+    def validateScalar(value: Any, path: str, errors: list) -> None:
+        if not isType(value):
+            errors.append(ConfigError(path, type_message))
+            return
+
+        for check, message in checks:
+            if not check(value):
+                errors.append(ConfigError(path, message))
+                return
+
+    return validateScalar
+
+
+CHANGE_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "trigger_frame": {"type": "int", "exclusive_minimum": 0},
+        "change_to": {"type": "int", "exclusive_minimum": 0},
+        "overwrite": {"type": "bool"}
+    }
+}
+
+TIMER_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "title": {"type": "string"},
+        "color": {"type": "color"},
+        "frames": {"type": "int", "exclusive_minimum": 0},
+        "visible": {"type": "bool"},
+        "changes": {"type": "array", "items": CHANGE_SCHEMA}
+    }
+}
+
+CONFIG_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "window_settings": {
+            "type": "object",
+            "fields": {
+                "bg_color": {"type": "color"},
+                "always_on_top": {"type": "bool"},
+                "global_hotkeys": {"type": "bool"},
+                "threaded_ticker": {"type": "bool", "required": False},
+                "catch_up": {"type": "bool", "required": False},
+                "renderer": {"type": "enum", "choices": RENDERERS, "required": False},
+                "stats_path": {"type": "string", "required": False},
+                "frame_rate": {"type": "number", "minimum": 1, "finite": True, "required": False},
+                "tolerance": {"type": "number", "minimum": 0, "maximum": MAX_TOLERANCE, "finite": True, "required": False},
+                "sleep_tolerance": {"type": "number", "minimum": 0, "maximum": MAX_TOLERANCE, "finite": True, "required": False}
+            }
+        },
+        "binds": {
+            "type": "object",
+            "fields": {
+                "startstop": {"type": "string"},
+                "restart": {"type": "string"}
+            }
+        },
+        "global_timer": {
+            "type": "object",
+            "fields": {
+                "color": {"type": "color"},
+                "frames": {"type": "int", "exclusive_minimum": 0}
+            }
+        },
+        "timers": {"type": "array", "items": TIMER_SCHEMA}
+    }
+}
+
+_validateConfig = compileNode(CONFIG_SCHEMA)
+
+def validateConfig(config: Any) -> list[ConfigError]:
+    errors = []
+    _validateConfig(config, "$", errors)
+
+    return errors
@@ -0,0 +1,37 @@
+from typing import Optional
+
+import json
+import os
+
+CACHE_DIR = "assets/cache"
+
+def getCachePath(name: str) -> str:
+    return os.path.join(CACHE_DIR, name)
+
+
+def loadCache(name: str) -> Optional[dict]:
+    try:
+        with open(getCachePath(name), "r") as f:
+            data = json.load(f)
+
+        return data if isinstance(data, dict) else None
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    except Exception as e:
+        print(f"Cache file error: {e}")
+
+    return None
+
+
+def saveCache(name: str, data: dict) -> bool:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+        with open(getCachePath(name), "w") as f:
+            json.dump(data, f)
+
+        return True
+    except Exception as e:
+        print(f"Failed to save cache file: {e}")
+
+    return False
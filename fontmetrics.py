@@ -0,0 +1,43 @@
+from diskcache import loadCache, saveCache
+
+import tkinter.font as tkfont
+
+class FontMetricsCache:
+    FILE_NAME = "fontmetrics.json"
+
+    def __init__(self) -> None:
+        self.heights = None
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        self.heights = loadCache(self.FILE_NAME) or {}
+
+    def textHeight(self, root, font_family: str, font_size: int) -> int:
+        if self.heights is None:
+            self._load()
+
+        scaling = float(root.tk.call("tk", "scaling"))
+        key = f"{font_family}|{font_size}|{scaling:.4f}"
+
+        if key in self.heights:
+            self.hits += 1
+            return self.heights[key]
+
+        self.misses += 1
+
+        font = tkfont.Font(root=root, family=font_family, size=font_size)
+
+        # canvas text bounding boxes carry 1px of padding on each side, the overlay layout was tuned with them
+        height = font.metrics("linespace") + 2
+
+        self.heights[key] = height
+        saveCache(self.FILE_NAME, self.heights)
+
+        return height
+
+
+FONT_METRICS = FontMetricsCache()
+
+def getTextHeight(root, font_family: str, font_size: int) -> int:
+    return FONT_METRICS.textHeight(root, font_family, font_size)
@@ -0,0 +1,42 @@
+import customtkinter as ctk
+
+class ImageCache:
+    def __init__(self) -> None:
+        self.images = {}
+        self.hits = 0
+        self.misses = 0
+
+    def getImage(self, path: str, size: tuple[int, int]) -> ctk.CTkImage:
+        key = (path, size)
+
+        if key in self.images:
+            self.hits += 1
+            return self.images[key]
+
+        self.misses += 1
+
+        from PIL import Image
+
+        with Image.open(path) as file:
+            file.load()
+            image = ctk.CTkImage(light_image=file.copy(), size=size)
+
+        self.images[key] = image
+
+        return image
+
+    def stats(self) -> dict:
+        return {
+            "images": len(self.images),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def report(self) -> None:
+        print(f"Image cache: {len(self.images)} images, {self.hits} hits, {self.misses} misses")
+
+
+IMAGE_CACHE = ImageCache()
+
+def getImage(path: str, size: tuple[int, int]) -> ctk.CTkImage:
+    return IMAGE_CACHE.getImage(path, size)
@@ -1,24 +1,37 @@
+from startupprofile import StartupProfiler
+
+import sys
+
+PROFILER = StartupProfiler("--profile-startup" in sys.argv)
+PROFILER.start()
+
 from timerscrollableframe import TimerScrollableFrame
-from timer import TimerView, validateConfigDict
+from timer import TimerView
+from presetformat import BINARY_EXTENSION, isBinaryPreset, writeBinaryPreset
+from presetlibrary import PRESET_LIBRARY
+from scheduler import DEFAULT_FRAME_RATE
+from calibration import Calibrator
+from fontmetrics import getTextHeight
+from imagecache import IMAGE_CACHE
 from typing import Optional, Callable, Any
-from tkextrafont import Font as exFont
 from colorpicker import ColorEntry
 from bindbutton import BindButton
 from tkinter import filedialog
 
 import customtkinter as ctk
-import webbrowser
-import keyboard
 import json
-
 import os
-os.system("cls")
+
+PROFILER.mark("imports")
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("assets/theme.json")
 
+PROFILER.mark("theme")
+
 VERSION = "v1.0.1"
 GITHUB_URL = "https://github.com/VicExe0/FNAF-Interval-Timer"
+MAX_PRESET_BUTTONS = 8
 
 def createNavButton(master, width: int, height: int, text: str, font: tuple, command: Callable) -> ctk.CTkButton:
     return ctk.CTkButton(master,
@@ -93,19 +106,40 @@ class App(ctk.CTk):
         self.timerWindow = None
         self.currentScreen = 0
         self.hotkey_ids = []
+        self.calibration = {}
+        self.calibrator = None
+        self.preset_buttons = []
+        self.preset_paths = None
+        self.live_apply_job = None
 
         self.bind("<Button-1>", self.mouse1ButtonDown)
 
+        PROFILER.mark("main window")
+
         if not self.loadFonts():
             print("Error: Failed to load fonts. Default fonts used instead")
 
+        PROFILER.mark("fonts")
+
         if not self.loadWidgets():
             print("Error: Failed to load widgets.")
             return
 
+        PROFILER.mark("widgets")
+
+        self.after_idle(self.warmFontMetrics)
+
     def start(self) -> None:
+        if PROFILER.enabled:
+            self.after_idle(self.reportStartup)
+
         self.mainloop()
 
+    def reportStartup(self) -> None:
+        PROFILER.mark("first frame")
+        PROFILER.report()
+        IMAGE_CACHE.report()
+
     def mouse1ButtonDown(self, event) -> None:
         if self.currentNavFrame and not self.isMouseInsideFrame(event, self.currentNavFrame):
             self.closeNavBarFrame()
@@ -121,6 +155,8 @@ class App(ctk.CTk):
             self.LCD_SOLID = "LCD Solid"
             self.CONSOLAS_REGULAR = "Consolas Regular"
 
+            from tkextrafont import Font as exFont
+
             exFont(file="assets/fonts/LcdSolid-VPzB.ttf", family=self.LCD_SOLID)
             exFont(file="assets/fonts/Consolas-Regular.ttf", family=self.CONSOLAS_REGULAR)
 
@@ -132,8 +168,14 @@ class App(ctk.CTk):
 
             return False
         
+    def warmFontMetrics(self) -> None:
+        for font_size in [TimerView.MAIN_TIMER_FONT_SIZE, TimerView.REGULAR_TIMER_FONT_SIZE]:
+            getTextHeight(self, self.LCD_SOLID, font_size)
+        
     def openGithub(self) -> None:
         self.closeNavBarFrame()
+
+        import webbrowser
         webbrowser.open(GITHUB_URL)
         
     def showNavFrame(self, id: int) -> None: 
@@ -147,6 +189,9 @@ class App(ctk.CTk):
             3: 180
         }.get(id, 0)
 
+        if id == 0:
+            self.refreshPresetMenu()
+
         frame = self.nav_frames[id]
         frame.placeFrame(x=pos, y=24)
         self.currentNavFrame = frame
@@ -155,7 +200,7 @@ class App(ctk.CTk):
         file_path = filedialog.asksaveasfilename(
             title="Save config",
             defaultextension=".json",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+            filetypes=[("JSON Files", "*.json"), ("Binary Presets", f"*{BINARY_EXTENSION}"), ("All Files", "*.*")]
         )
 
         if file_path is None:
@@ -164,9 +209,16 @@ class App(ctk.CTk):
         
         try:
             data = self.getConfigData()
-        
-            with open(file_path, "w") as file:
-                json.dump(data, file, indent=4)
+
+            if isBinaryPreset(file_path):
+                if not writeBinaryPreset(file_path, data):
+                    print("Failed to save config file.")
+                    return
+            else:
+                with open(file_path, "w") as file:
+                    json.dump(data, file, indent=4)
+
+            PRESET_LIBRARY.addFolder(os.path.dirname(file_path))
 
         except Exception as e:
             print("Failed to save config file.")
@@ -175,29 +227,62 @@ class App(ctk.CTk):
     def loadConfigFile(self) -> None:
         file_path = filedialog.askopenfilename(
             title="Load config",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+            filetypes=[("Presets", f"*.json *{BINARY_EXTENSION}"), ("JSON Files", "*.json"), ("Binary Presets", f"*{BINARY_EXTENSION}"), ("All Files", "*.*")]
         )
 
-        if file_path is None:
+        if not file_path:
             print("Failed to get file path.")
             return
         
-        try:
-            with open(file_path, "r") as file:
-                data = json.load(file)
+        PRESET_LIBRARY.addFolder(os.path.dirname(file_path))
+        self.loadPreset(file_path)
 
-            if not validateConfigDict(data):
-                print("Config file is corrupted or incorrect.")
-                return
-            
+    def loadPreset(self, path: str) -> None:
+        data = PRESET_LIBRARY.load(path)
+
+        if data is None:
+            print("Config file is corrupted or incorrect.")
+            return
+
+        try:
             self.loadInConfigData(data)
 
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Settings file error: {e}")
+            if PROFILER.enabled:
+                IMAGE_CACHE.report()
+
         except Exception as e:
             print(f"Unexpected error: {e}")
 
+    def refreshPresetMenu(self) -> None:
+        presets = PRESET_LIBRARY.scan()[:MAX_PRESET_BUTTONS]
+        paths = [preset["path"] for preset in presets]
+
+        if paths == self.preset_paths:
+            return
+
+        self.preset_paths = paths
+
+        for button in self.preset_buttons:
+            button.destroy()
+
+        self.preset_buttons = []
+
+        for index, preset in enumerate(presets):
+            button = NavSubButton(self.nav_file_frame, 120, 30, preset["name"], self.nav_font, lambda path=preset["path"]: self.selectPreset(path))
+            button.place(x=0, y=60 + index * 30)
+
+            self.preset_buttons.append(button)
+
+        self.nav_file_frame.configure(height=60 + len(presets) * 30)
+
+    def selectPreset(self, path: str) -> None:
+        self.closeNavBarFrame()
+        self.loadPreset(path)
+
     def changeView(self, id: int) -> None:
+        if self.view_frames[1].winfo_ismapped():
+            self.scheduleLiveApply()
+
         for view in self.view_frames:
             view.place_forget()
 
@@ -227,6 +312,33 @@ class App(ctk.CTk):
         self.timerWindow.createWindow()
         self.hotkey_ids = self.timerWindow.hotkey_ids
 
+    def scheduleLiveApply(self) -> None:
+        if self.live_apply_job is None:
+            self.live_apply_job = self.after_idle(self.liveApply)
+
+    def liveApply(self) -> None:
+        self.live_apply_job = None
+
+        if self.timerWindow is None:
+            return
+
+        if not self.timerWindow.reconfigure(self.getConfigData()):
+            print("Failed to apply the changes to the timer window.")
+
+    def calibrateTimer(self) -> None:
+        self.closeNavBarFrame()
+
+        if not self.calibrator is None:
+            return
+
+        def callback(result: dict) -> None:
+            self.calibration = result
+            self.calibrator = None
+            self.scheduleLiveApply()
+
+        self.calibrator = Calibrator(self, self.getFrameRate(), callback=callback)
+        self.calibrator.start()
+
     def changePreset(self, choose) -> None:
         self.choosedPreset = choose
 
@@ -238,6 +350,7 @@ class App(ctk.CTk):
             view_height = HEIGHT-NAVBAR_HEIGHT-20
             view_width = WIDTH-20
             consolas_regular15 = (self.CONSOLAS_REGULAR, 15)
+            self.nav_font = consolas_regular15
             consolas_regular20 = (self.CONSOLAS_REGULAR, 20)
             consolas_regular24 = (self.CONSOLAS_REGULAR, 24)
             consolas_regular30 = (self.CONSOLAS_REGULAR, 30)
@@ -249,7 +362,7 @@ class App(ctk.CTk):
             self.nav_version_label.place(relx=1.0, rely=0.5, anchor="e", x=-5)
 
             self.nav_file_frame = NavFrame(self, width=120, height=60, fg_color="#363636")
-            self.nav_settings_frame = NavFrame(self, width=120, height=60, fg_color="#363636")
+            self.nav_settings_frame = NavFrame(self, width=120, height=90, fg_color="#363636")
             self.nav_help_frame = NavFrame(self, width=120, height=60, fg_color="#363636")
             
             self.nav_frames = [self.nav_file_frame, self.nav_settings_frame, self.nav_help_frame]
@@ -266,6 +379,7 @@ class App(ctk.CTk):
             nav_file_load = NavSubButton(self.nav_file_frame, 120, 30, "Load config", consolas_regular15, self.loadConfigFile)
             nav_settings_change = NavSubButton(self.nav_settings_frame, 120, 30, "Settings", consolas_regular15, lambda: self.changeView(1))
             nav_settings_shtimer = NavSubButton(self.nav_settings_frame, 120, 30, "Show/Hide timer", consolas_regular15, self.toggleTimerWindow)
+            nav_settings_calibrate = NavSubButton(self.nav_settings_frame, 120, 30, "Calibrate timer", consolas_regular15, self.calibrateTimer)
             nav_help_about = NavSubButton(self.nav_help_frame, 120, 30, "About", consolas_regular15, lambda: self.changeView(2))
             nav_help_git = NavSubButton(self.nav_help_frame, 120, 30, "My Github", consolas_regular15, self.openGithub)
 
@@ -273,6 +387,7 @@ class App(ctk.CTk):
             nav_file_load.place(x=0, y=30)
             nav_settings_change.place(x=0, y=0)
             nav_settings_shtimer.place(x=0, y=30)
+            nav_settings_calibrate.place(x=0, y=60)
             nav_help_about.place(x=0, y=0)
             nav_help_git.place(x=0, y=30)
 
@@ -296,13 +411,13 @@ class App(ctk.CTk):
             binds_label.place(x=20, y=40)
 
             startstop_label = ctk.CTkLabel(self.view_settings, text="start/stop", text_color="#d1d1d1", font=consolas_regular20)
-            self.bind_startstop = BindButton(self.view_settings, default_button="`", width=150, height=20, font=consolas_regular20, fg_color="#424242", hover_color="#303030")
+            self.bind_startstop = BindButton(self.view_settings, default_button="`", on_change=self.scheduleLiveApply, width=150, height=20, font=consolas_regular20, fg_color="#424242", hover_color="#303030")
             
             startstop_label.place(x=20, y=70)
             self.bind_startstop.place(x=130, y=70)
 
             startstop_label = ctk.CTkLabel(self.view_settings, text="restart", text_color="#d1d1d1", font=consolas_regular20)
-            self.bind_reset = BindButton(self.view_settings, default_button="=", width=150, height=20, font=consolas_regular20, fg_color="#424242", hover_color="#303030")
+            self.bind_reset = BindButton(self.view_settings, default_button="=", on_change=self.scheduleLiveApply, width=150, height=20, font=consolas_regular20, fg_color="#424242", hover_color="#303030")
 
             startstop_label.place(x=20, y=100)
             self.bind_reset.place(x=130, y=100)
@@ -311,31 +426,59 @@ class App(ctk.CTk):
             window_label.place(x=20, y=150)
 
             bgcolor_label = ctk.CTkLabel(self.view_settings, text="background color", text_color="#d1d1d1", font=consolas_regular24)
-            self.bg_color_entry = ColorEntry(self.view_settings, height=20, width=120, font=consolas_regular20, default_color="#000000")
+            self.bg_color_entry = ColorEntry(self.view_settings, height=20, width=120, font=consolas_regular20, default_color="#000000", on_change=self.scheduleLiveApply)
 
             bgcolor_label.place(x=20, y=180)
             self.bg_color_entry.place(x=220, y=180)
 
             aot_label = ctk.CTkLabel(self.view_settings, text="always on top", text_color="#d1d1d1", font=consolas_regular24)
-            self.aot_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False)
+            self.aot_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False, command=self.scheduleLiveApply)
             
             aot_label.place(x=20, y=210)
             self.aot_checkbox.place(x=190, y=212, anchor="nw")
             self.aot_checkbox.select()
 
             gh_label = ctk.CTkLabel(self.view_settings, text="global hotkeys", text_color="#d1d1d1", font=consolas_regular24)
-            self.gh_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False)
+            self.gh_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False, command=self.scheduleLiveApply)
             
             gh_label.place(x=20, y=240)
             self.gh_checkbox.place(x=190, y=242, anchor="nw")
             self.gh_checkbox.select()
 
+            tt_label = ctk.CTkLabel(self.view_settings, text="threaded ticker", text_color="#d1d1d1", font=consolas_regular24)
+            self.tt_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False, command=self.scheduleLiveApply)
+            
+            tt_label.place(x=20, y=270)
+            self.tt_checkbox.place(x=190, y=272, anchor="nw")
+
+            cu_label = ctk.CTkLabel(self.view_settings, text="catch up frames", text_color="#d1d1d1", font=consolas_regular24)
+            self.cu_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False, command=self.scheduleLiveApply)
+            
+            cu_label.place(x=20, y=300)
+            self.cu_checkbox.place(x=190, y=302, anchor="nw")
+            self.cu_checkbox.select()
+
+            fr_label = ctk.CTkLabel(self.view_settings, text="frame rate", text_color="#d1d1d1", font=consolas_regular24)
+            self.fr_entry = ctk.CTkEntry(self.view_settings, width=80, height=20, font=consolas_regular20)
+            self.fr_entry.insert(0, str(DEFAULT_FRAME_RATE))
+            self.fr_entry.bind("<Return>", lambda event: self.scheduleLiveApply())
+            self.fr_entry.bind("<FocusOut>", lambda event: self.scheduleLiveApply())
+
+            fr_label.place(x=20, y=330)
+            self.fr_entry.place(x=190, y=332, anchor="nw")
+
+            cr_label = ctk.CTkLabel(self.view_settings, text="canvas renderer", text_color="#d1d1d1", font=consolas_regular24)
+            self.cr_checkbox = ctk.CTkCheckBox(self.view_settings, width=20, height=20, text="", onvalue=True, offvalue=False, command=self.scheduleLiveApply)
+
+            cr_label.place(x=20, y=360)
+            self.cr_checkbox.place(x=190, y=362, anchor="nw")
+
             about_label = ctk.CTkLabel(self.view_about, font=(self.CONSOLAS_REGULAR, 18), wraplength=WIDTH-60, anchor="w", justify="left", 
                                        text="The FNaF Interval Timer is a specialized tool designed for players tackling challenges in Five Nights at Freddy's that require precise management of animatronic movement opportunities.\n\
                                         \rWhether you're aiming for power efficiency in the \"Greenrun\" challenge or optimizing your night strategy, this timer helps you track the exact moments animatronics can move.")
             about_label.place(relx=0.5, rely=0.43, anchor="center")
 
-            self.timer_scroll_Frame = TimerScrollableFrame(self.view_timers, WIDTH-80, HEIGHT-100, consolas_regular24)
+            self.timer_scroll_Frame = TimerScrollableFrame(self.view_timers, WIDTH-80, HEIGHT-100, consolas_regular24, self.scheduleLiveApply)
             self.timer_scroll_Frame.place(relx=0.5, rely=0.5, anchor="center", y=15)
 
             return True
@@ -362,12 +505,47 @@ class App(ctk.CTk):
         else:
             self.gh_checkbox.deselect()
 
+        if window_settings.get("threaded_ticker", False):
+            self.tt_checkbox.select()
+        else:
+            self.tt_checkbox.deselect()
+
+        if window_settings.get("catch_up", True):
+            self.cu_checkbox.select()
+        else:
+            self.cu_checkbox.deselect()
+
+        if window_settings.get("renderer", "labels") == "canvas":
+            self.cr_checkbox.select()
+        else:
+            self.cr_checkbox.deselect()
+
+        self.fr_entry.delete(0, 'end')
+        self.fr_entry.insert(0, str(window_settings.get("frame_rate", DEFAULT_FRAME_RATE)))
+
+        self.calibration = {key: window_settings[key] for key in ["tolerance", "sleep_tolerance"] if key in window_settings}
+
         self.bind_startstop.setKey(binds["startstop"])
         self.bind_reset.setKey(binds["restart"])
         
         self.timer_scroll_Frame.setGlobalTimer(global_timer)
         self.timer_scroll_Frame.setTimers(timers)
 
+        self.scheduleLiveApply()
+
+    def getFrameRate(self) -> int | float:
+        frame_rate_entry_val = self.fr_entry.get()
+
+        if frame_rate_entry_val.isdigit() and int(frame_rate_entry_val) > 0:
+            return int(frame_rate_entry_val)
+
+        try:
+            frame_rate = float(frame_rate_entry_val)
+        except ValueError:
+            return DEFAULT_FRAME_RATE
+
+        return frame_rate if 1 <= frame_rate < float("inf") else DEFAULT_FRAME_RATE
+
     def getConfigData(self) -> dict:
         global_timer_data = self.timer_scroll_Frame.getGlobalTimerData()
 
@@ -375,7 +553,12 @@ class App(ctk.CTk):
             "window_settings": {
                 "bg_color": self.bg_color_entry.getColor()[1],
                 "always_on_top": bool(self.aot_checkbox.get()),
-                "global_hotkeys": bool(self.gh_checkbox.get())
+                "global_hotkeys": bool(self.gh_checkbox.get()),
+                "threaded_ticker": bool(self.tt_checkbox.get()),
+                "catch_up": bool(self.cu_checkbox.get()),
+                "frame_rate": self.getFrameRate(),
+                "renderer": "canvas" if self.cr_checkbox.get() else "labels",
+                **self.calibration
             },
             "binds": {
                 "startstop": self.bind_startstop.getKey(),
@@ -396,6 +579,8 @@ def main() -> None:
     app.start()
     
     if not app.hotkey_ids is None and not len(app.hotkey_ids) == 0:
+        import keyboard
+
         for hotkey_id in app.hotkey_ids:
 
             if hotkey_id is None: 
@@ -0,0 +1,169 @@
+from configschema import validateConfig
+from typing import Optional
+
+import struct
+import json
+import zlib
+
+BINARY_EXTENSION = ".fitb"
+MAGIC = b"FITP"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")           # magic, version, flags, crc32, payload length
+COUNTS = struct.Struct("<IIIHH")            # window settings length, timers, changes, startstop length, restart length
+GLOBAL_TIMER = struct.Struct("<7sq")         # color, frames
+TIMER_RECORD = struct.Struct("<7sq?II")     # color, frames, visible, title length in characters, change count
+CHANGE_RECORD = struct.Struct("<qq?")       # trigger frame, change to, overwrite
+
+def encodePreset(config: dict) -> bytes:
+    errors = validateConfig(config)
+
+    if errors:
+        raise ValueError(f"Cannot encode an invalid preset: {errors[0]}")
+
+    window_settings = json.dumps(config["window_settings"], separators=(",", ":")).encode("utf-8")
+    startstop = config["binds"]["startstop"].encode("utf-8")
+    restart = config["binds"]["restart"].encode("utf-8")
+    global_timer = config["global_timer"]
+    timers = config["timers"]
+
+    titles = [timer["title"] for timer in timers]
+    changes = [change for timer in timers for change in timer["changes"]]
+
+    parts = [
+        COUNTS.pack(len(window_settings), len(timers), len(changes), len(startstop), len(restart)),
+        window_settings,
+        startstop,
+        restart,
+        GLOBAL_TIMER.pack(global_timer["color"].encode("ascii"), global_timer["frames"])
+    ]
+
+    try:
+        parts.extend(
+            TIMER_RECORD.pack(timer["color"].encode("ascii"), timer["frames"], timer["visible"], len(title), len(timer["changes"]))
+            for timer, title in zip(timers, titles)
+        )
+        parts.extend(CHANGE_RECORD.pack(change["trigger_frame"], change["change_to"], change["overwrite"]) for change in changes)
+
+    except struct.error as e:
+        raise ValueError(f"Preset value does not fit the binary format: {e}")
+
+    parts.append("".join(titles).encode("utf-8"))
+
+    payload = b"".join(parts)
+
+    return HEADER.pack(MAGIC, VERSION, 0, zlib.crc32(payload), len(payload)) + payload
+
+
+def decodePreset(data: bytes) -> dict:
+    if len(data) < HEADER.size:
+        raise ValueError("Binary preset is truncated.")
+
+    magic, version, flags, crc, length = HEADER.unpack_from(data)
+
+    if magic != MAGIC:
+        raise ValueError("Not a binary preset.")
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary preset version {version}.")
+
+    payload = memoryview(data)[HEADER.size:]
+
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise ValueError("Binary preset checksum mismatch.")
+
+    try:
+        ws_length, timer_count, change_count, startstop_length, restart_length = COUNTS.unpack_from(payload)
+        offset = COUNTS.size
+
+        window_settings = json.loads(bytes(payload[offset:offset + ws_length]))
+        offset += ws_length
+
+        startstop = bytes(payload[offset:offset + startstop_length]).decode("utf-8")
+        offset += startstop_length
+
+        restart = bytes(payload[offset:offset + restart_length]).decode("utf-8")
+        offset += restart_length
+
+        global_color, global_frames = GLOBAL_TIMER.unpack_from(payload, offset)
+        offset += GLOBAL_TIMER.size
+
+        timer_end = offset + timer_count * TIMER_RECORD.size
+        change_end = timer_end + change_count * CHANGE_RECORD.size
+
+        timer_records = TIMER_RECORD.iter_unpack(payload[offset:timer_end])
+        change_records = list(CHANGE_RECORD.iter_unpack(payload[timer_end:change_end]))
+
+        titles = bytes(payload[change_end:]).decode("utf-8")
+        colors = {}
+        title_offset = 0
+        change_index = 0
+        timers = []
+
+        for color, frames, visible, title_length, changes in timer_records:
+            if not color in colors:
+                colors[color] = color.decode("ascii")
+
+            timers.append({
+                "title": titles[title_offset:title_offset + title_length],
+                "color": colors[color],
+                "frames": frames,
+                "visible": visible,
+                "changes": [
+                    {"trigger_frame": trigger_frame, "change_to": change_to, "overwrite": overwrite}
+                    for trigger_frame, change_to, overwrite in change_records[change_index:change_index + changes]
+                ]
+            })
+
+            title_offset += title_length
+            change_index += changes
+
+    except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Binary preset is corrupted: {e}")
+
+    if change_index != change_count or title_offset != len(titles):
+        raise ValueError("Binary preset records do not match their counts.")
+
+    return {
+        "window_settings": window_settings,
+        "binds": {
+            "startstop": startstop,
+            "restart": restart
+        },
+        "global_timer": {
+            "color": global_color.decode("ascii"),
+            "frames": global_frames
+        },
+        "timers": timers
+    }
+
+
+def isBinaryPreset(path: str) -> bool:
+    return path.lower().endswith(BINARY_EXTENSION)
+
+
+def readBinaryPreset(path: str) -> Optional[dict]:
+    try:
+        with open(path, "rb") as f:
+            return decodePreset(f.read())
+
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Binary preset error: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+
+    return None
+
+
+def writeBinaryPreset(path: str, config: dict) -> bool:
+    try:
+        data = encodePreset(config)
+
+        with open(path, "wb") as f:
+            f.write(data)
+
+        return True
+    except Exception as e:
+        print(f"Failed to save binary preset: {e}")
+
+    return False
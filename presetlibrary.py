@@ -0,0 +1,173 @@
+from presetformat import BINARY_EXTENSION, isBinaryPreset
+from timer import readConfigFile, validateConfigDict
+from diskcache import loadCache, saveCache
+from collections import OrderedDict
+from typing import Optional
+
+import os
+
+PRESET_DIR = "assets/saves"
+PRESET_EXTENSIONS = (".json", BINARY_EXTENSION)
+
+def copyPreset(config: dict) -> dict:
+    return {
+        "window_settings": dict(config["window_settings"]),
+        "binds": dict(config["binds"]),
+        "global_timer": dict(config["global_timer"]),
+        "timers": [
+            {**timer, "changes": [dict(change) for change in timer["changes"]]}
+            for timer in config["timers"]
+        ]
+    }
+
+
+class PresetLibrary:
+    FILE_NAME = "presetlibrary.json"
+
+    def __init__(self, folders: Optional[list[str]] = None, max_cached: int = 8) -> None:
+        self.folders = list(folders or [PRESET_DIR])
+        self.max_cached = max_cached
+        self.index = None
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        data = loadCache(self.FILE_NAME) or {}
+
+        self.index = data.get("files", {})
+
+        for folder in data.get("folders", []):
+            if not folder in self.folders:
+                self.folders.append(folder)
+
+    def _save(self) -> None:
+        saveCache(self.FILE_NAME, {"folders": self.folders, "files": self.index})
+
+    def addFolder(self, folder: str) -> None:
+        if self.index is None:
+            self._load()
+
+        folder = os.path.abspath(folder)
+
+        if any(os.path.abspath(known) == folder for known in self.folders):
+            return
+
+        self.folders.append(folder)
+        self._save()
+
+    def _readPreset(self, path: str) -> Optional[dict]:
+        config = readConfigFile(path)
+
+        if config is None:
+            return None
+
+        # binary presets are validated when written and carry a checksum
+        if not isBinaryPreset(path) and not validateConfigDict(config):
+            print(f"Preset '{path}' is corrupted or incorrect.")
+            return None
+
+        return config
+
+    def _cachePreset(self, path: str, stamp: tuple, config: dict) -> None:
+        self.cache[path] = (stamp, config)
+        self.cache.move_to_end(path)
+
+        while len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+
+    def scan(self) -> list[dict]:
+        if self.index is None:
+            self._load()
+
+        index = {}
+        changed = False
+
+        for folder in self.folders:
+            try:
+                names = sorted(os.listdir(folder))
+            except OSError:
+                continue
+
+            for name in names:
+                if not name.lower().endswith(PRESET_EXTENSIONS):
+                    continue
+
+                path = os.path.abspath(os.path.join(folder, name))
+
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                entry = self.index.get(path)
+
+                if not entry is None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    index[path] = entry
+                    continue
+
+                changed = True
+                config = self._readPreset(path)
+
+                if config is None:
+                    index[path] = {
+                        "mtime": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "invalid": True
+                    }
+                    continue
+
+                index[path] = {
+                    "name": os.path.splitext(name)[0],
+                    "mtime": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "timers": [timer["title"] for timer in config["timers"]]
+                }
+
+                self._cachePreset(path, (stat.st_mtime_ns, stat.st_size), config)
+
+        if changed or len(index) != len(self.index):
+            self.index = index
+            self._save()
+
+        return [{"path": path, **entry} for path, entry in index.items() if not entry.get("invalid", False)]
+
+    def load(self, path: str) -> Optional[dict]:
+        path = os.path.abspath(path)
+
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            print(f"Settings file error: {e}")
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.cache.get(path)
+
+        if not cached is None and cached[0] == stamp:
+            self.hits += 1
+            self.cache.move_to_end(path)
+            return copyPreset(cached[1])
+
+        self.misses += 1
+        config = self._readPreset(path)
+
+        if config is None:
+            return None
+
+        self._cachePreset(path, stamp, config)
+
+        return copyPreset(config)
+
+    def forget(self, path: str) -> None:
+        self.cache.pop(os.path.abspath(path), None)
+
+    def stats(self) -> dict:
+        return {
+            "cached": len(self.cache),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+PRESET_LIBRARY = PresetLibrary()
@@ -0,0 +1,94 @@
+from threading import Thread, Event, current_thread
+from collections import deque
+from fractions import Fraction
+
+import time
+
+NS_PER_MS = 1_000_000
+NS_PER_SECOND = 1_000_000_000
+DEFAULT_FRAME_RATE = 60
+MAX_TOLERANCE = 0.008      # seconds, half a frame at 60 fps
+
+class FrameScheduler:
+    def __init__(self, frame_rate: int | float = DEFAULT_FRAME_RATE, tolerance: float = 0.0) -> None:
+        rate = Fraction(frame_rate).limit_denominator(1000)
+
+        self.frame_rate = frame_rate
+        self.rate_num = rate.numerator
+        self.rate_den = rate.denominator
+        self.tolerance_ns = min(round(min(tolerance, MAX_TOLERANCE) * NS_PER_SECOND), NS_PER_SECOND * self.rate_den // (2 * self.rate_num))
+        self.start_ns = 0
+        self.ticks = 0
+        self.drift_ns = 0
+
+    def start(self) -> None:
+        self.start_ns = time.perf_counter_ns()
+        self.ticks = 0
+        self.drift_ns = 0
+
+    def deadline(self, tick: int) -> int:
+        return self.start_ns + tick * NS_PER_SECOND * self.rate_den // self.rate_num
+
+    def isDue(self, now: int) -> bool:
+        return self.deadline(self.ticks) - now < NS_PER_MS
+
+    def dueTicks(self, now: int) -> int:
+        elapsed = now + NS_PER_MS - self.start_ns
+        lastDue = (elapsed * self.rate_num - 1) // (NS_PER_SECOND * self.rate_den)
+
+        return max(0, lastDue + 1 - self.ticks)
+
+    def markTick(self, now: int, count: int = 1) -> None:
+        self.ticks += count
+        self.drift_ns = now - self.deadline(self.ticks - 1)
+
+    def nextDelay(self, now: int) -> int:
+        delay_ns = self.deadline(self.ticks) - now - self.tolerance_ns
+
+        return max(0, delay_ns // NS_PER_MS)
+
+    def pollDelay(self, now: int) -> int:
+        delay_ns = self.deadline(self.ticks) - now
+
+        return max(1, -(-delay_ns // NS_PER_MS))
+
+    def driftFrames(self) -> float:
+        return self.drift_ns * self.rate_num / (self.rate_den * NS_PER_SECOND)
+
+
+class TickerThread(Thread):
+    SPIN_NS = 2 * NS_PER_MS
+
+    def __init__(self, scheduler: FrameScheduler, spin_ns: int = SPIN_NS) -> None:
+        super().__init__(daemon=True)
+        self.scheduler = scheduler
+        self.spin_ns = spin_ns
+        self.frames = deque()
+        self.stop_event = Event()
+
+    def run(self) -> None:
+        scheduler = self.scheduler
+
+        while not self.stop_event.is_set():
+            deadline = scheduler.deadline(scheduler.ticks)
+            remaining = deadline - time.perf_counter_ns()
+
+            if remaining > self.spin_ns:
+                self.stop_event.wait((remaining - self.spin_ns) / NS_PER_SECOND)
+                continue
+
+            while time.perf_counter_ns() < deadline:
+                pass
+
+            if self.stop_event.is_set():
+                break
+
+            scheduler.markTick(time.perf_counter_ns())
+            self.frames.append((scheduler.ticks, scheduler.drift_ns))
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+        # the scheduler is shared with the next ticker, so wait until this one can no longer mark a tick
+        if self.is_alive() and not current_thread() is self:
+            self.join()
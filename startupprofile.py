@@ -0,0 +1,73 @@
+import builtins
+import time
+import sys
+
+NS_PER_MS = 1_000_000
+
+class StartupProfiler:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.start_ns = time.perf_counter_ns()
+        self.last_mark = self.start_ns
+        self.phases = []
+        self.imports = []
+        self.depth = 0
+        self.original_import = None
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+
+        self.original_import = builtins.__import__
+        builtins.__import__ = self._timedImport
+
+    def stop(self) -> None:
+        if not self.original_import is None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def _timedImport(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level != 0 or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+
+        depth = self.depth
+        start = time.perf_counter_ns()
+        self.depth += 1
+
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            self.depth -= 1
+            self.imports.append((name, depth, time.perf_counter_ns() - start))
+
+    def mark(self, phase: str) -> None:
+        if not self.enabled:
+            return
+
+        now = time.perf_counter_ns()
+        self.phases.append((phase, now - self.last_mark))
+        self.last_mark = now
+
+    def report(self, top: int = 15) -> None:
+        if not self.enabled:
+            return
+
+        self.stop()
+        total = self.last_mark - self.start_ns
+
+        print(f"Startup profile ({total / NS_PER_MS:.1f} ms to first frame)")
+        print("Phases:")
+
+        for phase, elapsed in self.phases:
+            print(f"  {phase:<24} {elapsed / NS_PER_MS:9.2f} ms")
+
+        print("Top-level imports:")
+
+        for name, depth, elapsed in self.imports:
+            if depth == 0:
+                print(f"  {name:<24} {elapsed / NS_PER_MS:9.2f} ms")
+
+        print("Slowest imports (including nested):")
+
+        for name, depth, elapsed in sorted(self.imports, key=lambda item: item[2], reverse=True)[:top]:
+            print(f"  {name:<24} {elapsed / NS_PER_MS:9.2f} ms  (depth {depth})")
@@ -0,0 +1,65 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from configschema import validateConfig
+
+import unittest
+import copy
+import json
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ConfigSchemaTest(unittest.TestCase):
+    def loadPreset(self) -> dict:
+        with open(os.path.join(REPO_ROOT, "assets/saves/fnaf1.json"), "r") as f:
+            return json.load(f)
+
+    def errorPaths(self, config: dict) -> list[str]:
+        return [error.path for error in validateConfig(config)]
+
+    def testValidPreset(self) -> None:
+        self.assertEqual(validateConfig(self.loadPreset()), [])
+
+    def testCatchesBadLaterTimers(self) -> None:
+        config = self.loadPreset()
+        bad = copy.deepcopy(config["timers"][0])
+        bad["color"] = "white"
+        bad["changes"] = [{"trigger_frame": 100, "change_to": -5, "overwrite": True}]
+
+        config["timers"].append(copy.deepcopy(config["timers"][0]))
+        config["timers"].append(bad)
+        last = len(config["timers"]) - 1
+
+        self.assertEqual(self.errorPaths(config), [f"$.timers[{last}].color", f"$.timers[{last}].changes[0].change_to"])
+
+    def testErrorPaths(self) -> None:
+        config = self.loadPreset()
+        config["window_settings"]["frame_rate"] = float("inf")
+        config["window_settings"]["renderer"] = "opengl"
+        del config["binds"]["restart"]
+        config["global_timer"]["frames"] = 0
+
+        self.assertEqual(self.errorPaths(config), [
+            "$.window_settings.renderer",
+            "$.window_settings.frame_rate",
+            "$.binds.restart",
+            "$.global_timer.frames"
+        ])
+        self.assertEqual(str(validateConfig(config)[-1]), "$.global_timer.frames: has to be higher than 0")
+
+    def testBoolIsNotAnInteger(self) -> None:
+        config = self.loadPreset()
+        config["global_timer"]["frames"] = True
+        config["timers"][0]["frames"] = False
+        config["window_settings"]["frame_rate"] = True
+
+        errors = validateConfig(config)
+
+        self.assertEqual([error.path for error in errors], ["$.window_settings.frame_rate", "$.global_timer.frames", "$.timers[0].frames"])
+        self.assertEqual([error.message for error in errors], ["expected a number", "expected an integer", "expected an integer"])
+
+
+if __name__ == "__main__":
+    unittest.main()
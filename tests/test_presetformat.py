@@ -0,0 +1,68 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from presetformat import BINARY_EXTENSION, HEADER, VERSION, encodePreset, decodePreset, readBinaryPreset, writeBinaryPreset
+
+import unittest
+import tempfile
+import json
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class PresetFormatTest(unittest.TestCase):
+    def loadPreset(self) -> dict:
+        with open(os.path.join(REPO_ROOT, "assets/saves/fnaf1.json"), "r") as f:
+            return json.load(f)
+
+    def testRoundTrip(self) -> None:
+        config = self.loadPreset()
+
+        self.assertEqual(decodePreset(encodePreset(config)), config)
+
+    def testRoundTripThroughFiles(self) -> None:
+        config = self.loadPreset()
+        config["timers"][0]["title"] = "Фредди ✓"
+        config["timers"][1]["title"] = ""
+        config["binds"]["startstop"] = "ä"
+        config["window_settings"]["frame_rate"] = 59.94
+        config["window_settings"]["renderer"] = "canvas"
+
+        with tempfile.TemporaryDirectory() as folder:
+            json_path = os.path.join(folder, "preset.json")
+            binary_path = os.path.join(folder, f"preset{BINARY_EXTENSION}")
+
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=4)
+
+            with open(json_path, "r", encoding="utf-8") as f:
+                self.assertTrue(writeBinaryPreset(binary_path, json.load(f)))
+
+            self.assertEqual(readBinaryPreset(binary_path), config)
+
+    def testRejectsCorruptedPayload(self) -> None:
+        data = bytearray(encodePreset(self.loadPreset()))
+        data[HEADER.size + 5] ^= 0xFF
+
+        with self.assertRaises(ValueError):
+            decodePreset(bytes(data))
+
+    def testRejectsBadHeader(self) -> None:
+        data = encodePreset(self.loadPreset())
+        magic, version, flags, crc, length = HEADER.unpack_from(data)
+
+        for bad in (data[:HEADER.size - 1], HEADER.pack(b"JSON", version, flags, crc, length) + data[HEADER.size:], HEADER.pack(magic, VERSION + 1, flags, crc, length) + data[HEADER.size:], data[:-1]):
+            with self.assertRaises(ValueError):
+                decodePreset(bad)
+
+    def testRejectsInvalidPreset(self) -> None:
+        config = self.loadPreset()
+        config["timers"][0]["frames"] = 0
+
+        with self.assertRaises(ValueError):
+            encodePreset(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
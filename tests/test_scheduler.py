@@ -0,0 +1,92 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import FrameScheduler, TickerThread, NS_PER_MS, NS_PER_SECOND
+
+import unittest
+import time
+
+FRAME_RATES = [60, 59.94, 50, 30, 144, 29.97]
+
+class FrameSchedulerTest(unittest.TestCase):
+    def testDeadlinesDoNotDrift(self) -> None:
+        for frame_rate in FRAME_RATES:
+            scheduler = FrameScheduler(frame_rate)
+            scheduler.start_ns = 123
+
+            # a whole number of seconds after num frames, however many have passed
+            for repeats in (1, 1000, 10 ** 9):
+                tick = scheduler.rate_num * repeats
+
+                self.assertEqual(scheduler.deadline(tick), 123 + scheduler.rate_den * repeats * NS_PER_SECOND)
+
+    def testDeadlinesStayWithinAFrame(self) -> None:
+        scheduler = FrameScheduler(59.94)
+
+        self.assertEqual((scheduler.rate_num, scheduler.rate_den), (2997, 50))
+        self.assertEqual(scheduler.deadline(1), 16683350)
+        self.assertEqual(scheduler.deadline(32100), 535535535535)
+
+    def testDueTicksMatchesIsDue(self) -> None:
+        for frame_rate in FRAME_RATES:
+            scheduler = FrameScheduler(frame_rate)
+            scheduler.start_ns = 0
+
+            for tick in range(1, 200):
+                boundary = scheduler.deadline(tick) - NS_PER_MS
+
+                # the deadline is floored, so tick becomes due exactly one nanosecond after the boundary
+                for now in (boundary, boundary + 1):
+                    scheduler.ticks = 0
+                    due = scheduler.dueTicks(now)
+
+                    self.assertEqual(due, tick + (now > boundary))
+
+                    scheduler.ticks = due
+                    self.assertFalse(scheduler.isDue(now))
+
+                    scheduler.ticks = due - 1
+                    self.assertTrue(scheduler.isDue(now))
+
+    def testDueTicksCountsOnlyMissedFrames(self) -> None:
+        scheduler = FrameScheduler(60)
+        scheduler.start_ns = 0
+        now = scheduler.deadline(10)
+
+        self.assertEqual(scheduler.dueTicks(now), 11)
+
+        scheduler.markTick(now, 8)
+
+        self.assertEqual(scheduler.dueTicks(now), 3)
+
+        scheduler.markTick(now, 3)
+
+        self.assertEqual(scheduler.dueTicks(now), 0)
+        self.assertEqual(scheduler.dueTicks(scheduler.start_ns - NS_PER_SECOND), 0)
+
+class TickerThreadTest(unittest.TestCase):
+    def testStoppedTickerDoesNotAdvanceRestartedScheduler(self) -> None:
+        scheduler = FrameScheduler(60)
+
+        for _ in range(20):
+            scheduler.start()
+
+            ticker = TickerThread(scheduler, spin_ns=20 * NS_PER_MS)
+            ticker.start()
+
+            # stop while the thread is spinning towards the next deadline
+            time.sleep(0.002)
+            ticker.stop()
+
+            self.assertFalse(ticker.is_alive())
+
+            scheduler.start()
+            time.sleep(0.02)
+
+            self.assertEqual(scheduler.ticks, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
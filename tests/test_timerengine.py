@@ -0,0 +1,175 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timerengine import TimerEngine, TimerState, compileChanges, loadTimerBank
+
+import unittest
+import random
+import copy
+
+class ReferenceTimer:
+    # per-frame semantics of the original TimerLabel, kept as the baseline the engine has to match
+    def __init__(self, frames: int, changes: list[dict]) -> None:
+        self.initialFrames = frames
+        self.changes = [dict(change) for change in changes]
+        self.resetToInitial()
+
+    def resetToInitial(self) -> None:
+        self.remainingFrames = self.initialFrames
+        self.maxFrames = self.initialFrames
+
+        for change in self.changes:
+            change["done"] = False
+
+    def update(self, globalFrames: int) -> None:
+        for change in self.changes:
+            if change["done"] or globalFrames > change["trigger_frame"]:
+                continue
+
+            self.maxFrames = change["change_to"]
+
+            if change["overwrite"]:
+                self.remainingFrames = self.maxFrames
+
+            change["done"] = True
+
+        if self.remainingFrames <= 0:
+            self.remainingFrames = self.maxFrames
+
+
+def referenceRun(global_frames: int, timers: list[dict]) -> list[list[int]]:
+    side = [ReferenceTimer(timer["frames"], timer["changes"]) for timer in timers if timer["visible"]]
+
+    for timer in side:
+        timer.update(global_frames)
+
+    remaining = global_frames
+    states = [[remaining, *[timer.remainingFrames for timer in side]]]
+
+    while True:
+        remaining -= 1
+        finished = remaining <= 0
+
+        if finished:
+            remaining = global_frames
+
+        for timer in side:
+            if timer.remainingFrames > 0:
+                timer.remainingFrames -= 1
+
+            timer.update(remaining)
+
+        states.append([remaining, *[timer.remainingFrames for timer in side]])
+
+        if finished:
+            return states
+
+
+def randomPreset(rng: random.Random) -> tuple[int, list[dict]]:
+    global_frames = rng.randint(1, 400)
+
+    timers = [
+        {
+            "title": f"Timer {index}",
+            "color": "#ffffff",
+            "frames": rng.randint(1, 50),
+            "visible": rng.random() < 0.8,
+            "changes": [
+                {
+                    "trigger_frame": rng.randint(1, 450),
+                    "change_to": rng.randint(1, 60),
+                    "overwrite": rng.random() < 0.5
+                }
+                for _ in range(rng.randint(0, 4))
+            ]
+        }
+        for index in range(rng.randint(0, 5))
+    ]
+
+    return global_frames, timers
+
+
+class TimerEngineTest(unittest.TestCase):
+    PRESETS = 200
+    use_bank = False
+
+    def setUp(self) -> None:
+        if self.use_bank and loadTimerBank() is None:
+            self.skipTest("NumPy is not installed")
+
+    def createEngine(self, global_frames: int, timers: list[dict]) -> TimerEngine:
+        return TimerEngine({"frames": global_frames}, copy.deepcopy(timers), use_bank=self.use_bank)
+
+    def stepAll(self, engine: TimerEngine) -> list[list[int]]:
+        states = [[timer.remainingFrames for timer in engine.timers]]
+
+        engine.resume()
+
+        while engine.step():
+            states.append([timer.remainingFrames for timer in engine.timers])
+
+        return states
+
+    def testStepMatchesReference(self) -> None:
+        rng = random.Random(1)
+
+        for _ in range(self.PRESETS):
+            global_frames, timers = randomPreset(rng)
+
+            self.assertEqual(self.stepAll(self.createEngine(global_frames, timers)), referenceRun(global_frames, timers))
+
+    def testFramesAtMatchesStepping(self) -> None:
+        rng = random.Random(2)
+
+        for _ in range(self.PRESETS):
+            global_frames, timers = randomPreset(rng)
+            states = referenceRun(global_frames, timers)
+            engine = self.createEngine(global_frames, timers)
+
+            for frame in range(global_frames):
+                self.assertEqual(engine.framesAt(frame), states[frame])
+
+    def testSeekThenStepMatchesStepping(self) -> None:
+        rng = random.Random(3)
+
+        for _ in range(self.PRESETS):
+            global_frames, timers = randomPreset(rng)
+            states = referenceRun(global_frames, timers)
+            engine = self.createEngine(global_frames, timers)
+
+            for frame in rng.sample(range(global_frames), min(5, global_frames)):
+                self.assertEqual(engine.seek(frame), states[frame])
+                self.assertEqual(self.stepAll(engine), states[frame:])
+
+    def testResetRestartsTheNight(self) -> None:
+        global_frames, timers = randomPreset(random.Random(4))
+        engine = self.createEngine(global_frames, timers)
+        states = self.stepAll(engine)
+
+        engine.reset()
+
+        self.assertFalse(engine.running)
+        self.assertEqual(self.stepAll(engine), states)
+
+
+class TimerBankTest(TimerEngineTest):
+    use_bank = True
+
+
+class TimerStateTest(unittest.TestCase):
+    def testConfigureChangesMatchesCompileChanges(self) -> None:
+        changes = [
+            {"trigger_frame": 50, "change_to": 7, "overwrite": False},
+            {"trigger_frame": 90, "change_to": 3, "overwrite": True},
+            {"trigger_frame": 50, "change_to": 9, "overwrite": True}
+        ]
+        state = TimerState(10, changes[:2])
+        state.configureChanges(changes[2])
+
+        self.assertEqual(state.frameChanges, compileChanges(changes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+from scheduler import NS_PER_MS
+from collections import deque
+
+import json
+import math
+
+def percentile(sorted_values: list, percent: float) -> float:
+    if not sorted_values:
+        return 0
+
+    index = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+
+    return sorted_values[index]
+
+
+class TickStats:
+    LATENESS_SAMPLES = 4096  # recent frames kept for the lateness percentiles
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.ticks = 0
+        self.frames = 0
+        self.caught_up_frames = 0
+        self.stalls = 0
+        self.lateness = deque(maxlen=self.LATENESS_SAMPLES)
+        self.lateness_total_ns = 0
+        self.lateness_max_ns = 0
+        self.renders = 0
+        self.render_total_ns = 0
+        self.render_max_ns = 0
+        self.redraws = 0
+        self.skipped_redraws = 0
+
+    def recordTick(self, lateness: list[int]) -> None:
+        count = len(lateness)
+
+        self.ticks += 1
+        self.frames += count
+        self.lateness.extend(lateness)
+
+        if count:
+            self.lateness_total_ns += sum(lateness)
+            self.lateness_max_ns = max(self.lateness_max_ns, max(lateness))
+
+        if count > 1:
+            self.caught_up_frames += count - 1
+            self.stalls += 1
+
+    def recordRender(self, elapsed_ns: int, redraws: int, skipped: int) -> None:
+        self.renders += 1
+        self.redraws += redraws
+        self.skipped_redraws += skipped
+        self.render_total_ns += elapsed_ns
+        self.render_max_ns = max(self.render_max_ns, elapsed_ns)
+
+    def summary(self, drift_frames: float = 0.0) -> dict:
+        lateness = sorted(self.lateness)
+        mean_lateness = self.lateness_total_ns / self.frames if self.frames else 0
+        mean_render = self.render_total_ns / self.renders if self.renders else 0
+
+        return {
+            "ticks": self.ticks,
+            "frames": self.frames,
+            "caught_up_frames": self.caught_up_frames,
+            "stalls": self.stalls,
+            "drift_frames": drift_frames,
+            "lateness_ms": {
+                "mean": mean_lateness / NS_PER_MS,
+                "p50": percentile(lateness, 50) / NS_PER_MS,
+                "p99": percentile(lateness, 99) / NS_PER_MS,
+                "max": self.lateness_max_ns / NS_PER_MS
+            },
+            "render_ms": {
+                "count": self.renders,
+                "redraws": self.redraws,
+                "skipped_redraws": self.skipped_redraws,
+                "total": self.render_total_ns / NS_PER_MS,
+                "mean": mean_render / NS_PER_MS,
+                "max": self.render_max_ns / NS_PER_MS
+            }
+        }
+
+
+def dumpStats(path: str, stats: dict) -> bool:
+    try:
+        with open(path, "w") as f:
+            json.dump(stats, f, indent=4)
+
+        return True
+    except Exception as e:
+        print(f"Failed to save timer stats: {e}")
+
+    return False
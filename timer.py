@@ -1,28 +1,21 @@
-from typing import Optional, Any
+from scheduler import FrameScheduler, TickerThread, NS_PER_MS, NS_PER_SECOND, DEFAULT_FRAME_RATE, MAX_TOLERANCE
+from timerengine import TimerEngine
+from tickstats import TickStats, dumpStats
+from timerlabel import TimerLabel, TimerCanvas, CanvasTimerLabel
+from fontmetrics import getTextHeight
+from configschema import validateConfig, RENDERERS
+from presetformat import isBinaryPreset, readBinaryPreset
+from typing import Optional
 from threading import Thread
 
 import customtkinter as ctk
-import tkinter as tk
-import keyboard
 import time
 import json
-import re
-
-def getTextHeight(font_family, font_size):
-    root = tk.Tk()
-    root.withdraw()
-
-    canvas = tk.Canvas(root)
-    font = (font_family, font_size)
-    text_id = canvas.create_text(0, 0, text="A", font=font, anchor="nw")
-    bbox = canvas.bbox(text_id)
-    text_height = bbox[3] - bbox[1]
-
-    root.destroy()
-    return text_height
-
 
 def readConfigFile(path: str) -> Optional[dict]:
+    if isBinaryPreset(path):
+        return readBinaryPreset(path)
+
     try:
         with open(path, "r") as f:
             data = json.load(f)
@@ -37,251 +30,27 @@ def readConfigFile(path: str) -> Optional[dict]:
 
 
 def validateConfigDict(config) -> bool:
-    MIN_FRAME_REQ = 0
-
-    def isValidColor(hex_value: str) -> bool:
-        return bool(re.fullmatch(r"#[0-9a-fA-F]{6}", hex_value))
-    
-    def existsWithInstance(data: dict, value: str, instance: type | tuple) -> bool:
-        return value in data and isinstance(data[value], instance)
-    
-    def validateChanges(changes: list) -> bool:
-        if not isinstance(changes, list):
-            print("Invalid type of 'changes'.")
-            return False
-        
-        for change in changes:
-            if not existsWithInstance(change, "trigger_frame", int):
-                print("Missing or invalid 'trigger_frame'.")
-                return False
-            
-            if change["trigger_frame"] <= MIN_FRAME_REQ:
-                print(f"'trigger_frame' has to be higher than {MIN_FRAME_REQ}")
-                return False
-            
-            if not existsWithInstance(change, "change_to", int):
-                print("Missing or invalid 'change_to'.")
-                return False
-            
-            if change["change_to"] <= MIN_FRAME_REQ:
-                print(f"'change_to' has to be higher than {MIN_FRAME_REQ}")
-                return False
-            
-            if not existsWithInstance(change, "overwrite", bool):
-                print("Missing or invalid 'overwrite'.")
-                return False
-
-        return True
-
-    def validateTimers(timers: list) -> bool:
-        if not isinstance(timers, list):
-            print("Invalid type of 'timers'.")
-            return False
-        
-        if len(timers) == 0:
-            return True
-        
-        for timer in timers:
-            if not existsWithInstance(timer, "color", str):
-                print("Missing or invalid 'color' in timer.")
-                return False
-            
-            if not isValidColor(timer["color"]):
-                print("Invalid 'color'.")
-                return False
-            
-            if not existsWithInstance(timer, "frames", int):
-                print("Missing or invalid 'frames'.")
-                return False
-            
-            if not existsWithInstance(timer, "title", str):
-                print("Missing or invalid 'title'.")
-                return False
-            
-            if not existsWithInstance(timer, "visible", bool):
-                print("Missing or invalid 'visible'.")
-                return False
-            
-            if timer["frames"] <= MIN_FRAME_REQ:
-                print(f"'frames' has to be higher than {MIN_FRAME_REQ}")
-                return False
-            
-            if not existsWithInstance(timer, "changes", list):
-                print("Missing or invalid 'changes' in 'timers'")
-                return False
-            
-            if len(timer["changes"]) > 0 and not validateChanges(timer["changes"]):
-                print("Invalid changes")
-                return False
-            
-            return True
-
-    def validateWS(ws: dict) -> bool:
-        if not existsWithInstance(ws, "bg_color", str):
-            print("Missing or invalid 'bg_color' in 'window_settings'.")
-            return False
-        
-        if not isValidColor(ws["bg_color"]):
-            print("Invalid 'bg_color' in 'window_settings'.")
-            return False
-        
-        if not existsWithInstance(ws, "always_on_top", bool):
-            print("Missing or invalid 'always_on_top' in 'window_settings'.")
-            return False
-        
-        if not existsWithInstance(ws, "global_hotkeys", bool):
-            print("Missing or invalid 'global_hotkeys' in 'window_settings'.")
-            return False
-        
-        return True
-        
-
-    def validateBinds(binds: dict) -> bool:
-        if not existsWithInstance(binds, "startstop", str):
-            print("Missing or invalid 'startstop' in 'binds'.")
-            return False
-        
-        if not existsWithInstance(binds, "restart", str):
-            print("Missing or invalid 'restart' in 'binds'.")
-            return False
-        
-        return True
-
-    def validateGT(gt: dict) -> bool:
-        if not existsWithInstance(gt, "color", str):
-            print("Missing or invalid 'color' in 'global_timer'.")
-            return False
-        
-        if not isValidColor(gt["color"]):
-            print("Invalid 'color' in 'global_timer'.")
-            return False
-        
-        if not existsWithInstance(gt, "frames", int):
-            print("Missing or invalid 'frames' in 'global_timer'.")
-            return False
-        
-        if gt["frames"] <= MIN_FRAME_REQ:
-            print(f"'frames' has to be higher than {MIN_FRAME_REQ}")
-            return False
-        
-        return True
-
-
-    FUNCTIONS = {
-        "window_settings": validateWS,
-        "binds": validateBinds,
-        "global_timer": validateGT
-    }
-
-    for key in ["window_settings", "binds", "global_timer"]:
-        if not existsWithInstance(config, key, dict):
-            print(f"Missing or invalid '{key}'.")
-            return False
-        
-        validateFunc = FUNCTIONS[key]
-
-        if not validateFunc(config[key]):
-            print(f"Invalid '{key}' structure.")
-            return False
-    
-    if "timers" not in config or not isinstance(config["timers"], list):
-        print("Missing or invalid 'timers'.")
-        return False
-    
-    if not validateTimers(config["timers"]):
-        print("Invalid 'timers' structure.")
-        return False
-
-    return True
-
-
-class TimerLabel:
-    def __init__(self, master, total_frames: int, padLength: int, color: str, font: tuple) -> None:
-        self.label = ctk.CTkLabel(master, text=f"{total_frames:0>{padLength}}", text_color=color, font=font)
-        self.maxFrames = total_frames
-        self.remainingFrames = total_frames
-        self.initialFrames = total_frames
-        self.padLength = padLength
-        self.isGlobal = False
-        self.frameChanges = []
-        self.numFrameChanges = 0
-        self.master = master
-
-    def _applyFrameChanges(self, globalFrames: int) -> None:
-        for change in self.frameChanges:
-            if change["done"] or globalFrames > change["trigger_frame"]:
-                continue
-
-            self.maxFrames = change["change_to"]
-
-            if change["overwrite"]:
-                self.reset()
-
-            change["done"] = True
-
-    def configureChanges(self, *changes: dict | list[dict]) -> None:
-        if not changes:
-            return
-
-        if len(changes) == 1 and isinstance(changes[0], list):
-            changeList = changes[0]
-        else:
-            changeList = changes
-
-        for change in changeList:
-            change["done"] = False
-            self.frameChanges.append(change)
-
-        self.numFrameChanges = len(self.frameChanges)
-
-    def setGlobalState(self, state: bool = True) -> None:
-        self.isGlobal = state
-
-    def resetToInitial(self) -> None:
-        self.remainingFrames = self.initialFrames
-        self.maxFrames = self.initialFrames
-
-        for change in self.frameChanges:
-            change["done"] = False
-
-    def decrementFrames(self) -> None:
-        if self.remainingFrames > 0:
-            self.remainingFrames -= 1
-
-    def reset(self) -> None:
-        self.remainingFrames = self.maxFrames
-
-    def place(self, **kwargs) -> None:
-        self.label.place(**kwargs)
-
-    def update(self, globalFrames: int) -> None:
-        if not self.isGlobal and self.numFrameChanges != 0:
-            self._applyFrameChanges(globalFrames)
-
-        if self.remainingFrames <= 0:
-            self.reset()
+    errors = validateConfig(config)
 
-        self.label.configure(text=f"{self.remainingFrames:0>{self.padLength}}")
+    for error in errors:
+        print(f"Invalid config: {error}")
 
-    def __getattr__(self, value: Any) -> Optional[Any]:
-        if value in self.__dict__:
-            return self.__dict__[value]
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{value}'")
+    return not errors
 
 
 class TimerView(ctk.CTkToplevel):
+    MAIN_TIMER_FONT_SIZE = 45      # global timer font size
+    REGULAR_TIMER_FONT_SIZE = 40   # rest of the timers font size
+
     def __init__(self, master, font: str, config_data: Optional[dict] = None, config_path: Optional[str] = None):
         self.master = master
         self.font = font
         self.always_on_top = True
-        self.running = False
-        self.frame_length = 1 / 60
         self.hotkey_ids = []
-        self.TOLERANCE = 0.00285535499956796
-
-        self.time_o = 0
-        self.total = 0
-        self.count = 0
+        self.tick_job = None
+        self.render_job = None
+        self.ticker = None
+        self.tick_stats = TickStats()
         
         if not config_data is None:
             self.config = config_data
@@ -298,6 +67,13 @@ class TimerView(ctk.CTkToplevel):
         if not validateConfigDict(self.config):
             raise ValueError(f"Config data is corrupted or incorrect.")
 
+        self.engine = TimerEngine(self.config['global_timer'], self.config['timers'])
+
+        window_settings = self.config['window_settings']
+        self.stats_path = window_settings.get('stats_path', "timer_stats.json")
+        self.renderer = window_settings.get('renderer', "labels")
+        self._loadTimingSettings(window_settings)
+
     def _makeWindowDragable(self) -> bool:
         try:
             self.overrideredirect(True)
@@ -322,14 +98,34 @@ class TimerView(ctk.CTkToplevel):
             return False
 
         
+    def _addGlobalHotkeys(self, binds: dict) -> None:
+        import keyboard
+
+        self.hotkey_ids.append(keyboard.add_hotkey(binds.get('startstop', 'ctrl+alt+s'), self.pauseResumeTimers))
+        self.hotkey_ids.append(keyboard.add_hotkey(binds.get('restart', 'ctrl+alt+r'), self.resetTimers))
+
     def _setupGlobalHotkeys(self, binds: dict):
+        import keyboard
+
         def listener():
-            self.hotkey_ids.append(keyboard.add_hotkey(binds.get('startstop', 'ctrl+alt+s'), self.pauseResumeTimers))
-            self.hotkey_ids.append(keyboard.add_hotkey(binds.get('restart', 'ctrl+alt+r'), self.resetTimers))
+            self._addGlobalHotkeys(binds)
             keyboard.wait()
 
         Thread(target=listener, daemon=True).start()
 
+    def _removeBinds(self, window_settings: dict, binds: dict) -> None:
+        if self.hotkey_ids:
+            import keyboard
+
+            for hotkey_id in self.hotkey_ids:
+                keyboard.remove_hotkey(hotkey_id)
+
+            self.hotkey_ids.clear()
+
+        if not window_settings.get('global_hotkeys', False):
+            self.unbind(binds.get('startstop', '<Control-s>'))
+            self.unbind(binds.get('restart', '<Control-r>'))
+
     def _loadConfig(self) -> bool:
         try:
             window_settings = self.config.get('window_settings', {})
@@ -356,31 +152,38 @@ class TimerView(ctk.CTkToplevel):
             return False
         
     def _createTimerLabels(self, global_timer: dict, timers: list[dict], height: int, font: str, font_sizes: list[int]) -> None:
+        if self.renderer == "canvas":
+            print("The canvas renderer is experimental, switch back to labels if the timers look wrong.")
+            self.timer_canvas = TimerCanvas(self, self.config['window_settings']['bg_color'])
+            self.timer_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+            master, labelClass = self.timer_canvas, CanvasTimerLabel
+        else:
+            master, labelClass = self, TimerLabel
+
+        self.label_master, self.label_class = master, labelClass
+        self.side_font = (font, font_sizes[1])
+        self.timer_height = height
+
         frames = global_timer['frames']
         paddingWidth = max(len(str(frames)), 4)
 
-        self.g_timer = TimerLabel(self, frames, paddingWidth, global_timer['color'], (font, font_sizes[0]))
+        self.g_timer = labelClass(master, self.engine.globalTimer, paddingWidth, global_timer['color'], (font, font_sizes[0]))
         self.g_timer.place(relx=0.5, y=23, anchor="center")
-        self.g_timer.setGlobalState()
         
         self.all_timers = [self.g_timer]
 
-        y_pos = 7
-        for timer in timers:
-            if not timer["visible"]:
-                continue
+        visible_timers = [timer for timer in timers if timer["visible"]]
 
-            frames = timer["frames"]
-            paddingWidth = max(len(str(frames)), 4)
-            
-            side_timer = TimerLabel(self, frames, paddingWidth, timer['color'], (font, font_sizes[1]))
-            side_timer.configureChanges(timer['changes'])
-            
-            y_pos += height
+        for index, (timer, state) in enumerate(zip(visible_timers, self.engine.sideTimers)):
+            self.all_timers.append(self._createSideLabel(index, timer, state))
+
+    def _createSideLabel(self, index: int, timer: dict, state) -> TimerLabel:
+        paddingWidth = max(len(str(timer["frames"])), 4)
 
-            side_timer.place(x=5, y=y_pos)
+        side_timer = self.label_class(self.label_master, state, paddingWidth, timer['color'], self.side_font)
+        side_timer.place(x=5, y=7 + self.timer_height * (index + 1))
 
-            self.all_timers.append(side_timer)
+        return side_timer
 
 
     def createWindow(self) -> None:
@@ -400,11 +203,13 @@ class TimerView(ctk.CTkToplevel):
             self.config['timers'],
         )
 
-        main_timer_font_size = 45      # global timer font size
-        regular_timer_font_size = 40   # rest of the timers font size
+        main_timer_font_size = self.MAIN_TIMER_FONT_SIZE
+        regular_timer_font_size = self.REGULAR_TIMER_FONT_SIZE
+
+        g_timer_height = getTextHeight(self, self.font, main_timer_font_size)
+        timer_height = getTextHeight(self, self.font, regular_timer_font_size)
 
-        g_timer_height = getTextHeight(self.font, main_timer_font_size)
-        timer_height = getTextHeight(self.font, regular_timer_font_size)
+        self.g_timer_height = g_timer_height
 
         timers_count = sum(1 for i in timers if i.get("visible", False))
         window_height = g_timer_height + timer_height * timers_count
@@ -414,53 +219,231 @@ class TimerView(ctk.CTkToplevel):
 
         self._createTimerLabels(global_timer, timers, timer_height, self.font, [main_timer_font_size, regular_timer_font_size])
 
+    def _loadTimingSettings(self, window_settings: dict) -> None:
+        self.threaded_ticker = window_settings.get('threaded_ticker', False)
+        self.catch_up = window_settings.get('catch_up', True)
+        self.frame_rate = window_settings.get('frame_rate', DEFAULT_FRAME_RATE)
+        self.scheduler = FrameScheduler(self.frame_rate, window_settings.get('tolerance', 0.0))
+        self.spin_ns = TickerThread.SPIN_NS + round(min(window_settings.get('sleep_tolerance', 0.0), MAX_TOLERANCE) * NS_PER_SECOND)
+
+    def reconfigure(self, config: dict) -> bool:
+        if not validateConfigDict(config):
+            return False
+
+        old_settings, old_binds = self.config['window_settings'], self.config['binds']
+        window_settings, global_timer, timers = config['window_settings'], config['global_timer'], config['timers']
+
+        self.configure(fg_color=window_settings['bg_color'])
+        self.attributes('-topmost', window_settings.get('always_on_top', False))
+
+        if old_binds != config['binds'] or old_settings.get('global_hotkeys', False) != window_settings.get('global_hotkeys', False):
+            self._removeBinds(old_settings, old_binds)
+
+            if window_settings.get('global_hotkeys', False):
+                self._addGlobalHotkeys(config['binds'])
+            else:
+                self.bind(config['binds'].get('startstop', '<Control-s>'), self.pauseResumeTimers)
+                self.bind(config['binds'].get('restart', '<Control-r>'), self.resetTimers)
+
+        running = self.engine.running
+        engine = TimerEngine(global_timer, timers)
+        frame = min(self.engine.frame, engine.globalTimer.initialFrames)
+
+        engine.seek(frame)
+        engine.running = running and frame < engine.globalTimer.initialFrames
+
+        self.engine = engine
+        self.config = config
+        self.stats_path = window_settings.get('stats_path', "timer_stats.json")
+
+        renderer = window_settings.get('renderer', "labels")
+        visible_timers = [timer for timer in timers if timer["visible"]]
+        visible_count = len(self.all_timers) - 1
+
+        if renderer != self.renderer:
+            for label in self.all_timers:
+                label.destroy()
+
+            if self.renderer == "canvas":
+                self.timer_canvas.destroy()
+
+            self.renderer = renderer
+            self._createTimerLabels(global_timer, timers, self.timer_height, self.font, [self.MAIN_TIMER_FONT_SIZE, self.REGULAR_TIMER_FONT_SIZE])
+        else:
+            if self.renderer == "canvas":
+                self.timer_canvas.configure(bg=window_settings['bg_color'])
+
+            self.g_timer.rebind(engine.globalTimer, max(len(str(global_timer['frames'])), 4), global_timer['color'])
+
+            for index, (timer, state) in enumerate(zip(visible_timers, engine.sideTimers)):
+                if index < visible_count:
+                    self.all_timers[index + 1].rebind(state, max(len(str(timer["frames"])), 4), timer['color'])
+                else:
+                    self.all_timers.append(self._createSideLabel(index, timer, state))
+
+            for label in self.all_timers[len(visible_timers) + 1:]:
+                label.destroy()
+
+            del self.all_timers[len(visible_timers) + 1:]
+
+        if len(visible_timers) != visible_count:
+            self.geometry(f"200x{self.g_timer_height + self.timer_height * len(visible_timers)}")
+
+        timing = ('threaded_ticker', 'catch_up', 'frame_rate', 'tolerance', 'sleep_tolerance')
+
+        if any(old_settings.get(key) != window_settings.get(key) for key in timing):
+            self._cancelTick()
+            self._loadTimingSettings(window_settings)
+
+            if engine.running:
+                self._startTicking()
+
+        elif running and not engine.running:
+            self._cancelTick()
+
+        self.renderTimers()
+
+        return True
+
     def destroyWindow(self) -> None:
         if hasattr(self, "_drag_callbacks"):
             for event, callback in self._drag_callbacks.items():
                 self.unbind(event)
 
         self.unbind_all("<Key>")
+        self._cancelTick()
+
+        if not self.render_job is None:
+            self.after_cancel(self.render_job)
+            self.render_job = None
+
+        if self.stats_path:
+            dumpStats(self.stats_path, self.stats())
 
-        for hotkey_id in self.hotkey_ids:
-            keyboard.remove_hotkey(hotkey_id)
+        if self.hotkey_ids:
+            import keyboard
+
+            for hotkey_id in self.hotkey_ids:
+                keyboard.remove_hotkey(hotkey_id)
         
         self.hotkey_ids = []
 
         self.destroy()
 
-    def resetTimers(self, *args) -> None:
-        self.running = False
+    def _cancelTick(self) -> None:
+        if not self.tick_job is None:
+            self.after_cancel(self.tick_job)
+            self.tick_job = None
+
+        if not self.ticker is None:
+            self.ticker.stop()
+            self.ticker = None
+
+    def _startTicking(self) -> None:
+        self.scheduler.start()
+
+        if self.threaded_ticker:
+            self.ticker = TickerThread(self.scheduler, self.spin_ns)
+            self.ticker.start()
+            self.drainTicker()
+        else:
+            self.updateTimers()
+
+    def renderTimers(self) -> None:
+        if self.render_job is None:
+            self.render_job = self.after_idle(self._flushRender)
+
+    def _flushRender(self) -> None:
+        self.render_job = None
+        start = time.perf_counter_ns()
+        redraws = 0
 
         for timer in self.all_timers:
-            timer.resetToInitial()
-            timer.update(self.g_timer.remainingFrames)
+            if timer.update():
+                redraws += 1
+
+        self.tick_stats.recordRender(time.perf_counter_ns() - start, redraws, len(self.all_timers) - redraws)
+
+    def stats(self) -> dict:
+        return self.tick_stats.summary(self.scheduler.driftFrames())
+
+    def resetTimers(self, *args) -> None:
+        self._cancelTick()
+        self.engine.reset()
+        self.tick_stats.reset()
+        self.renderTimers()
+
+    def seekTimers(self, frame: int) -> None:
+        self._cancelTick()
+        self.engine.seek(frame)
+        self.renderTimers()
+
+        if self.engine.running:
+            self._startTicking()
 
     def pauseResumeTimers(self, *args) -> None:
-        self.running = not self.running
+        self._cancelTick()
 
-        self.time_o = time.perf_counter()
+        if self.engine.toggle():
+            self._startTicking()
 
-        if self.running:
-            self.total = 0
-            self.last_time = time.perf_counter()
-            self.updateTimers()
+    def _scheduleTick(self, delay: int, callback) -> None:
+        self.tick_job = self.after(delay, callback)
+
+    def reportDrift(self) -> None:
+        drift_ms = self.scheduler.drift_ns / NS_PER_MS
+        print(f"Night finished after {self.scheduler.ticks} frames, drift: {drift_ms:.3f} ms ({self.scheduler.driftFrames():.3f} frames)")
+        print(f"Caught up {self.tick_stats.caught_up_frames} frames over {self.tick_stats.stalls} stalls")
+
+    def _applyFrames(self, lateness: list[int]) -> None:
+        self.tick_stats.recordTick(lateness)
+        self.engine.step(len(lateness))
+        self.renderTimers()
 
     def updateTimers(self) -> None:
-        if not self.running:
+        self.tick_job = None
+
+        if not self.engine.running:
             return
         
-        start_time = time.perf_counter()
+        now = time.perf_counter_ns()
+
+        if not self.scheduler.isDue(now):
+            self._scheduleTick(self.scheduler.nextDelay(now), self.updateTimers)
+            return
+
+        count = self.scheduler.dueTicks(now) if self.catch_up else 1
+        first = self.scheduler.ticks
+
+        self.scheduler.markTick(now, count)
+        self._applyFrames([now - self.scheduler.deadline(tick) for tick in range(first, first + count)])
+
+        if not self.engine.running:
+            self.reportDrift()
+            return
 
-        for index, timer in enumerate(self.all_timers):
-            timer.decrementFrames()
+        self._scheduleTick(self.scheduler.nextDelay(time.perf_counter_ns()), self.updateTimers)
 
-            if index == 0 and timer.remainingFrames <= 0:
-                self.running = False
+    def drainTicker(self) -> None:
+        self.tick_job = None
 
-            timer.update(self.g_timer.remainingFrames)
+        if not self.engine.running or self.ticker is None:
+            self._cancelTick()
+            return
+
+        frames = self.ticker.frames
+        lateness = []
+
+        while frames:
+            frame, frame_lateness = frames.popleft()
+            lateness.append(frame_lateness)
 
-        elapsed = time.perf_counter() - start_time
-        delay = max(0, self.frame_length - elapsed - self.TOLERANCE)
-        self.total += delay
+        if lateness:
+            self._applyFrames(lateness)
+
+        if not self.engine.running:
+            self._cancelTick()
+            self.reportDrift()
+            return
 
-        self.after(int(delay * 1000), self.updateTimers)
\ No newline at end of file
+        self._scheduleTick(self.scheduler.pollDelay(time.perf_counter_ns()), self.drainTicker)
\ No newline at end of file
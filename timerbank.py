@@ -0,0 +1,130 @@
+from timerengine import buildSegments, compileChanges, segmentValue
+
+import numpy as np
+
+class TimerSlot:
+    __slots__ = ("bank", "index")
+
+    def __init__(self, bank: "TimerBank", index: int) -> None:
+        self.bank = bank
+        self.index = index
+
+    @property
+    def remainingFrames(self) -> int:
+        return int(self.bank.remainingFrames[self.index])
+
+    @property
+    def maxFrames(self) -> int:
+        return int(self.bank.maxFrames[self.index])
+
+    @property
+    def initialFrames(self) -> int:
+        return int(self.bank.initialFrames[self.index])
+
+    def framesAt(self, tick: int) -> tuple[int, int]:
+        return self.bank.framesAt(self.index, tick)
+
+
+class TimerBank:
+    def __init__(self, timers: list[dict], globalFrames: int) -> None:
+        count = len(timers)
+
+        self.initialFrames = np.array([timer["frames"] for timer in timers], dtype=np.int64)
+        self.maxFrames = self.initialFrames.copy()
+        self.remainingFrames = self.initialFrames.copy()
+
+        changes = []
+        segmentStart, segmentRemaining, segmentMax = [], [], []
+        self.segmentOffsets = np.zeros(count + 1, dtype=np.int64)
+
+        for timer, data in enumerate(timers):
+            frameChanges = compileChanges(data["changes"])
+            changes.extend((trigger, timer, index, changeTo, overwrite) for trigger, index, changeTo, overwrite in frameChanges)
+
+            for start, remaining, maxFrames in buildSegments(data["frames"], frameChanges, globalFrames):
+                segmentStart.append(start)
+                segmentRemaining.append(remaining)
+                segmentMax.append(maxFrames)
+
+            self.segmentOffsets[timer + 1] = len(segmentStart)
+
+        self.segmentStart = np.array(segmentStart, dtype=np.int64)
+        self.segmentRemaining = np.array(segmentRemaining, dtype=np.int64)
+        self.segmentMax = np.array(segmentMax, dtype=np.int64)
+
+        changes.sort(key=lambda change: (-change[0], change[1], change[2]))
+
+        self.changeTriggers = np.array([change[0] for change in changes], dtype=np.int64)
+        self.changeTimers = np.array([change[1] for change in changes], dtype=np.int64)
+        self.changeOrder = np.array([change[2] for change in changes], dtype=np.int64)
+        self.changeTo = np.array([change[3] for change in changes], dtype=np.int64)
+        self.changeOverwrite = np.array([change[4] for change in changes], dtype=bool)
+        self.negTriggers = -self.changeTriggers
+        self.numFrameChanges = len(changes)
+        self.changeCursor = 0
+
+        self.slots = [TimerSlot(self, index) for index in range(count)]
+
+    def framesAt(self, index: int, tick: int) -> tuple[int, int]:
+        start, end = self.segmentOffsets[index], self.segmentOffsets[index + 1]
+        segment = start + int(np.searchsorted(self.segmentStart[start:end], tick, side="right")) - 1
+
+        return segmentValue((int(self.segmentStart[segment]), int(self.segmentRemaining[segment]), int(self.segmentMax[segment])), tick)
+
+    def _applyFrameChanges(self, globalFrames: int) -> None:
+        cursor = self.changeCursor
+
+        if cursor >= self.numFrameChanges or globalFrames > self.changeTriggers[cursor]:
+            return
+
+        end = int(np.searchsorted(self.negTriggers, -globalFrames, side="right"))
+        order = np.lexsort((self.changeOrder[cursor:end], self.changeTimers[cursor:end]))
+
+        timers = self.changeTimers[cursor:end][order]
+        changeTo = self.changeTo[cursor:end][order]
+        overwrite = self.changeOverwrite[cursor:end][order]
+
+        last = np.append(timers[1:] != timers[:-1], True)
+        self.maxFrames[timers[last]] = changeTo[last]
+
+        if overwrite.any():
+            timers, changeTo = timers[overwrite], changeTo[overwrite]
+            last = np.append(timers[1:] != timers[:-1], True)
+            self.remainingFrames[timers[last]] = changeTo[last]
+
+        self.changeCursor = end
+
+    def _wrap(self) -> None:
+        np.copyto(self.remainingFrames, self.maxFrames, where=self.remainingFrames <= 0)
+
+    def reset(self, globalFrames: int) -> None:
+        np.copyto(self.remainingFrames, self.initialFrames)
+        np.copyto(self.maxFrames, self.initialFrames)
+        self.changeCursor = 0
+
+        self._applyFrameChanges(globalFrames)
+        self._wrap()
+
+    def step(self, globalFrames: int) -> None:
+        remaining = self.remainingFrames
+
+        np.subtract(remaining, 1, out=remaining, where=remaining > 0)
+        self._applyFrameChanges(globalFrames)
+        self._wrap()
+
+    def seek(self, tick: int, globalFrames: int) -> None:
+        if len(self.slots):
+            # every timer's first segment starts at tick 0, so counting the started segments finds the current one
+            started = np.add.reduceat((self.segmentStart <= tick).astype(np.int64), self.segmentOffsets[:-1])
+            segment = self.segmentOffsets[:-1] + started - 1
+
+            start = self.segmentStart[segment]
+            remaining = self.segmentRemaining[segment]
+            maxFrames = self.segmentMax[segment]
+            elapsed = tick - start
+
+            wrapped = maxFrames - (elapsed - remaining) % maxFrames
+            self.remainingFrames[:] = np.where(elapsed < remaining, remaining - elapsed, wrapped)
+            self.maxFrames[:] = maxFrames
+
+        self.changeCursor = int(np.searchsorted(self.negTriggers, tick - globalFrames, side="right"))
@@ -0,0 +1,278 @@
+from typing import Optional
+from bisect import bisect_right
+
+BANK_MIN_TIMERS = 64
+
+def loadTimerBank() -> Optional[type]:
+    try:
+        from timerbank import TimerBank
+    except ImportError:
+        return None
+
+    return TimerBank
+
+def segmentValue(segment: tuple[int, int, int], tick: int) -> tuple[int, int]:
+    start, remaining, maxFrames = segment
+    elapsed = tick - start
+
+    if elapsed < remaining:
+        return remaining - elapsed, maxFrames
+
+    return maxFrames - (elapsed - remaining) % maxFrames, maxFrames
+
+
+def buildSegments(initialFrames: int, frameChanges: tuple, globalFrames: int) -> list[tuple[int, int, int]]:
+    fireTicks = {}
+
+    for change in sorted(frameChanges, key=lambda change: change[1]):
+        tick = max(0, globalFrames - change[0])
+        fireTicks.setdefault(tick, []).append(change)
+
+    segments = [(0, initialFrames, initialFrames)]
+
+    for tick in sorted(fireTicks):
+        if tick == 0:
+            remaining, maxFrames = initialFrames, initialFrames
+        else:
+            remaining, maxFrames = segmentValue(segments[-1], tick - 1)
+            remaining -= 1
+
+        for trigger, index, changeTo, overwrite in fireTicks[tick]:
+            maxFrames = changeTo
+
+            if overwrite:
+                remaining = maxFrames
+
+        if remaining <= 0:
+            remaining = maxFrames
+
+        if tick == 0:
+            segments[0] = (0, remaining, maxFrames)
+        else:
+            segments.append((tick, remaining, maxFrames))
+
+    return segments
+
+
+def compileChanges(changes: list[dict]) -> tuple:
+    compiled = [(change["trigger_frame"], index, change["change_to"], change["overwrite"]) for index, change in enumerate(changes)]
+    compiled.sort(key=lambda change: (-change[0], change[1]))
+
+    return tuple(compiled)
+
+
+class TimerState:
+    def __init__(self, total_frames: int, changes: Optional[list[dict]] = None) -> None:
+        self.maxFrames = total_frames
+        self.remainingFrames = total_frames
+        self.initialFrames = total_frames
+        self.isGlobal = False
+        self.changes = []
+        self.frameChanges = ()
+        self.changeTriggers = []
+        self.numFrameChanges = 0
+        self.changeCursor = 0
+        self.segmentTicks = [0]
+        self.segments = [(0, total_frames, total_frames)]
+
+        if changes:
+            self.configureChanges(changes)
+
+    def _applyFrameChanges(self, globalFrames: int) -> None:
+        cursor = self.changeCursor
+
+        if globalFrames > self.frameChanges[cursor][0]:
+            return
+
+        end = cursor + 1
+        while end < self.numFrameChanges and globalFrames <= self.frameChanges[end][0]:
+            end += 1
+
+        due = self.frameChanges[cursor:end]
+
+        if len(due) > 1:
+            due = sorted(due, key=lambda change: change[1])
+
+        for trigger, index, changeTo, overwrite in due:
+            self.maxFrames = changeTo
+
+            if overwrite:
+                self.reset()
+
+        self.changeCursor = end
+
+    def configureChanges(self, *changes: dict | list[dict]) -> None:
+        if not changes:
+            return
+
+        if len(changes) == 1 and isinstance(changes[0], list):
+            changeList = changes[0]
+        else:
+            changeList = changes
+
+        # compiled the same way as TimerBank, so both apply simultaneous changes in the same order
+        self.changes.extend(changeList)
+        self.frameChanges = compileChanges(self.changes)
+        self.changeTriggers = [-change[0] for change in self.frameChanges]
+        self.numFrameChanges = len(self.frameChanges)
+        self.changeCursor = 0
+
+    def setGlobalState(self, state: bool = True) -> None:
+        self.isGlobal = state
+
+    def resetToInitial(self) -> None:
+        self.remainingFrames = self.initialFrames
+        self.maxFrames = self.initialFrames
+        self.changeCursor = 0
+
+    def decrementFrames(self) -> None:
+        if self.remainingFrames > 0:
+            self.remainingFrames -= 1
+
+    def reset(self) -> None:
+        self.remainingFrames = self.maxFrames
+
+    def buildSchedule(self, globalFrames: int) -> None:
+        self.segments = buildSegments(self.initialFrames, self.frameChanges, globalFrames)
+        self.segmentTicks = [segment[0] for segment in self.segments]
+
+    def framesAt(self, tick: int) -> tuple[int, int]:
+        index = bisect_right(self.segmentTicks, tick) - 1
+
+        return segmentValue(self.segments[index], tick)
+
+    def seek(self, tick: int, globalFrames: int) -> None:
+        self.remainingFrames, self.maxFrames = self.framesAt(tick)
+        self.changeCursor = bisect_right(self.changeTriggers, tick - globalFrames)
+
+    def update(self, globalFrames: int) -> None:
+        if not self.isGlobal and self.changeCursor < self.numFrameChanges:
+            self._applyFrameChanges(globalFrames)
+
+        if self.remainingFrames <= 0:
+            self.reset()
+
+
+class TimerEngine:
+    def __init__(self, global_timer: dict, timers: list[dict], use_bank: Optional[bool] = None) -> None:
+        self.globalTimer = TimerState(global_timer["frames"])
+        self.globalTimer.setGlobalState()
+
+        visibleTimers = [timer for timer in timers if timer["visible"]]
+
+        if use_bank is None:
+            use_bank = len(visibleTimers) >= BANK_MIN_TIMERS
+
+        TimerBank = loadTimerBank() if use_bank else None
+
+        if use_bank and TimerBank is None:
+            print("NumPy is not installed, falling back to per-timer updates.")
+            use_bank = False
+
+        if use_bank:
+            self.sideStates = []
+            self.bank = TimerBank(visibleTimers, self.globalTimer.initialFrames)
+            self.sideTimers = self.bank.slots
+        else:
+            self.sideStates = [TimerState(timer["frames"], timer["changes"]) for timer in visibleTimers]
+
+            for timer in self.sideStates:
+                timer.buildSchedule(self.globalTimer.initialFrames)
+
+            self.bank = None
+            self.sideTimers = self.sideStates
+
+        self.timers = [self.globalTimer, *self.sideTimers]
+
+        self.running = False
+        self.frame = 0
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.running = False
+        self.frame = 0
+
+        self.globalTimer.resetToInitial()
+        self.globalTimer.update(self.globalTimer.remainingFrames)
+
+        if not self.bank is None:
+            self.bank.reset(self.globalTimer.remainingFrames)
+            return
+
+        for timer in self.sideStates:
+            timer.resetToInitial()
+            timer.update(self.globalTimer.remainingFrames)
+
+    def pause(self) -> None:
+        self.running = False
+
+    def resume(self) -> None:
+        self.running = True
+
+    def toggle(self) -> bool:
+        self.running = not self.running
+
+        return self.running
+
+    def _checkFrame(self, frame: int) -> None:
+        if not 0 <= frame <= self.globalTimer.initialFrames:
+            raise ValueError(f"Frame {frame} is outside of the night (0-{self.globalTimer.initialFrames}).")
+
+    def framesAt(self, frame: int) -> list[int]:
+        self._checkFrame(frame)
+
+        globalFrames = self.globalTimer.initialFrames
+        remaining = [globalFrames - frame if frame < globalFrames else globalFrames]
+        remaining.extend(timer.framesAt(frame)[0] for timer in self.sideTimers)
+
+        return remaining
+
+    def seek(self, frame: int) -> list[int]:
+        self._checkFrame(frame)
+
+        globalFrames = self.globalTimer.initialFrames
+
+        self.frame = frame
+        self.globalTimer.maxFrames = globalFrames
+        self.globalTimer.remainingFrames = globalFrames - frame if frame < globalFrames else globalFrames
+
+        if not self.bank is None:
+            self.bank.seek(frame, globalFrames)
+        else:
+            for timer in self.sideStates:
+                timer.seek(frame, globalFrames)
+
+        if frame == globalFrames:
+            self.running = False
+
+        return [timer.remainingFrames for timer in self.timers]
+
+    def step(self, n: int = 1) -> int:
+        if not self.running:
+            return 0
+
+        globalTimer = self.globalTimer
+        bank = self.bank
+
+        for index in range(n):
+            self.frame += 1
+
+            globalTimer.decrementFrames()
+            finished = globalTimer.remainingFrames <= 0
+            globalTimer.update(globalTimer.remainingFrames)
+
+            globalFrames = globalTimer.remainingFrames
+
+            if not bank is None:
+                bank.step(globalFrames)
+            else:
+                for timer in self.sideStates:
+                    timer.decrementFrames()
+                    timer.update(globalFrames)
+
+            if finished:
+                self.running = False
+                return index + 1
+
+        return n
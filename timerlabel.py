@@ -1,74 +1,105 @@
+from timerengine import TimerState
 from typing import Optional, Any
+
 import customtkinter as ctk
+import tkinter as tk
 
 class TimerLabel:
-    def __init__(self, master, total_frames: int, padLength: int, color: str, font: tuple) -> None:
-        self.label = ctk.CTkLabel(master, text=f"{total_frames:0>{padLength}}", text_color=color, font=font)
-        self.maxFrames = total_frames
-        self.remainingFrames = total_frames
-        self.initialFrames = total_frames
+    def __init__(self, master, timer: TimerState, padLength: int, color: str, font: tuple) -> None:
+        self.label = ctk.CTkLabel(master, text=f"{timer.remainingFrames:0>{padLength}}", text_color=color, font=font)
+        self.timer = timer
         self.padLength = padLength
-        self.isGlobal = False
-        self.frameChanges = []
-        self.numFrameChanges = 0
+        self.color = color
+        self.master = master
+        self.renderedFrames = timer.remainingFrames
 
-    def _applyFrameChanges(self, globalFrames: int) -> None:
-        for change in self.frameChanges:
-            if change["done"] or globalFrames > change["trigger_frame"]:
-                continue
+    def place(self, **kwargs) -> None:
+        self.label.place(**kwargs)
 
-            self.maxFrames = change["change_to"]
+    def render(self, text: str) -> None:
+        self.label.configure(text=text)
 
-            if change["overwrite"]:
-                self.reset()
+    def setColor(self, color: str) -> None:
+        self.label.configure(text_color=color)
 
-            change["done"] = True
+    def destroy(self) -> None:
+        self.label.destroy()
 
-    def configureChanges(self, *changes: dict | list[dict]) -> None:
-        if not changes:
-            return
+    def rebind(self, timer: TimerState, padLength: int, color: str) -> None:
+        self.timer = timer
 
-        if len(changes) == 1 and isinstance(changes[0], list):
-            changeList = changes[0]
-        else:
-            changeList = changes
+        if color != self.color:
+            self.setColor(color)
+            self.color = color
 
-        for change in changeList:
-            change["done"] = False
-            self.frameChanges.append(change)
+        if padLength != self.padLength:
+            self.padLength = padLength
+            self.renderedFrames = None
 
-        self.numFrameChanges = len(self.frameChanges)
+    def update(self) -> bool:
+        remainingFrames = self.timer.remainingFrames
 
-    def setGlobalState(self, state: bool = True) -> None:
-        self.isGlobal = state
+        if remainingFrames == self.renderedFrames:
+            return False
 
-    def resetToInitial(self) -> None:
-        self.remainingFrames = self.initialFrames
-        self.maxFrames = self.initialFrames
+        self.render(f"{remainingFrames:0>{self.padLength}}")
+        self.renderedFrames = remainingFrames
 
-        for change in self.frameChanges:
-            change["done"] = False
+        return True
 
-    def decrementFrames(self) -> None:
-        if self.remainingFrames > 0:
-            self.remainingFrames -= 1
+    def __getattr__(self, value: Any) -> Optional[Any]:
+        if value in self.__dict__:
+            return self.__dict__[value]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{value}'")
 
-    def reset(self) -> None:
-        self.remainingFrames = self.maxFrames
 
-    def place(self, **kwargs) -> None:
-        self.label.place(**kwargs)
+class TimerCanvas(tk.Canvas):
+    def __init__(self, master, bg_color: str) -> None:
+        super().__init__(master, bg=bg_color, highlightthickness=0, borderwidth=0)
 
-    def update(self, globalFrames: int) -> None:
-        if not self.isGlobal and self.numFrameChanges != 0:
-            self._applyFrameChanges(globalFrames)
+        self.scaling = ctk.ScalingTracker.get_widget_scaling(master)
+        self.relative_items = {}
 
-        if self.remainingFrames <= 0:
-            self.reset()
+        self.bind("<Configure>", self._onResize)
 
-        self.label.configure(text=f"{self.remainingFrames:0>{self.padLength}}")
+    def scaleFont(self, font: tuple) -> tuple:
+        return font[0], -abs(round(font[1] * self.scaling))
 
-    def __getattr__(self, value: Any) -> Optional[Any]:
-        if value in self.__dict__:
-            return self.__dict__[value]
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{value}'")
+    def placeItem(self, item: int, x: float = 0, y: float = 0, relx: Optional[float] = None, anchor: str = "nw") -> None:
+        self.itemconfigure(item, anchor=anchor)
+
+        if relx is None:
+            self.relative_items.pop(item, None)
+            self.coords(item, x * self.scaling, y * self.scaling)
+            return
+
+        self.relative_items[item] = (relx, x * self.scaling, y * self.scaling)
+        self.coords(item, self.winfo_width() * relx + x * self.scaling, y * self.scaling)
+
+    def _onResize(self, event) -> None:
+        for item, (relx, x, y) in self.relative_items.items():
+            self.coords(item, event.width * relx + x, y)
+
+
+class CanvasTimerLabel(TimerLabel):
+    def __init__(self, canvas: TimerCanvas, timer: TimerState, padLength: int, color: str, font: tuple) -> None:
+        self.canvas = canvas
+        self.item = canvas.create_text(0, 0, text=f"{timer.remainingFrames:0>{padLength}}", fill=color, font=canvas.scaleFont(font), anchor="nw")
+        self.timer = timer
+        self.padLength = padLength
+        self.color = color
+        self.master = canvas
+        self.renderedFrames = timer.remainingFrames
+
+    def place(self, **kwargs) -> None:
+        self.canvas.placeItem(self.item, **kwargs)
+
+    def render(self, text: str) -> None:
+        self.canvas.itemconfigure(self.item, text=text)
+
+    def setColor(self, color: str) -> None:
+        self.canvas.itemconfigure(self.item, fill=color)
+
+    def destroy(self) -> None:
+        self.canvas.relative_items.pop(self.item, None)
+        self.canvas.delete(self.item)
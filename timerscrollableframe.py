@@ -1,10 +1,15 @@
-from changescrollableframe import ChangeScrollableFrame
 from typing import Optional, Callable, Any
 from colorpicker import ColorEntry
-from PIL import Image
+from imagecache import getImage
+from widgetpool import WidgetPool
 
 import customtkinter as ctk
 
+ROW_HEIGHT = 50
+ROW_PADDING = 5
+ROW_OVERSCAN = 2
+SPARE_ROWS = 16
+
 class GlobalTimerEditor(ctk.CTkToplevel):
     def __init__(self, parent, data: dict, font: tuple, callback: Callable) -> None:
         super().__init__(parent)
@@ -60,28 +65,20 @@ class Editor(ctk.CTkToplevel):
     def __init__(self, parent, data: dict, callback, font: tuple) -> None:
         super().__init__(parent)
 
-        self.data = data
-        self.callback = callback
-
-        title = self.data["title"]
-
-        self.title(title)
         self.geometry("350x400")
         self.configure(fg_color="#292929")
         self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
 
         self.title_label = ctk.CTkLabel(self, text="Title", font=(font[0], 20))
         self.title_entry = ctk.CTkEntry(self, width=100, height=30, font=(font[0], 15))
 
-        self.title_entry.insert(0, title)
-
         self.title_label.place(x=20, y=20)
         self.title_entry.place(x=65, y=20)
 
         self.color_label = ctk.CTkLabel(self, text="Color", font=(font[0], 20))
         self.color_entry = ColorEntry(self, height=25, width=140, font=font, default_color="#ffffff")
 
-        self.color_entry.setColor([0, self.data["color"]])
 
         self.color_label.place(x=20, y=60)
         self.color_entry.place(x=75, y=60)
@@ -89,12 +86,13 @@ class Editor(ctk.CTkToplevel):
         self.default_frames_label = ctk.CTkLabel(self, text="Default frames", font=(font[0], 20))
         self.default_frames_entry = ctk.CTkEntry(self, width=100, height=30, font=(font[0], 15))
 
-        self.default_frames_entry.insert(0, str(self.data["frames"]))
 
         self.default_frames_label.place(x=20, y=100)
         self.default_frames_entry.place(x=155, y=100)
 
-        self.changes_scrollable_frame = ChangeScrollableFrame(self, self.data["changes"], 300, 100, font)
+        from changescrollableframe import ChangeScrollableFrame
+
+        self.changes_scrollable_frame = ChangeScrollableFrame(self, [], 300, 100, font)
         self.changes_scrollable_frame.place(relx=0.5, y=135, anchor="n")
         
         self.cancel_button = ctk.CTkButton(self, text="Cancel", font=font, corner_radius=5, fg_color="#cf0c43", hover_color="#780e2c", command=self.cancel)
@@ -103,6 +101,29 @@ class Editor(ctk.CTkToplevel):
         self.cancel_button.place(rely=0.9, relx=0.5, anchor="e", x=-10)
         self.apply_button.place(rely=0.9, relx=0.5, anchor="w", x=10)
 
+        self.load(data, callback)
+
+    def load(self, data: dict, callback) -> None:
+        self.data = data
+        self.callback = callback
+
+        self.title(data["title"])
+
+        self.title_entry.delete(0, "end")
+        self.title_entry.insert(0, data["title"])
+
+        self.color_entry.setColor([0, data["color"]])
+
+        self.default_frames_entry.delete(0, "end")
+        self.default_frames_entry.insert(0, str(data["frames"]))
+
+        self.changes_scrollable_frame.setChanges(data["changes"])
+        self.changes_scrollable_frame._parent_canvas.yview_moveto(0)
+
+        self.deiconify()
+        self.lift()
+        self.focus_set()
+
     def submit(self) -> None:
         frames = self.data["frames"]
         frames_entry_val = self.default_frames_entry.get()
@@ -119,20 +140,21 @@ class Editor(ctk.CTkToplevel):
         }
 
         self.callback(data)
-        self.destroy()
+        self.withdraw()
 
     def cancel(self) -> None:
-        self.destroy()
+        self.withdraw()
 
 
 class TimerBlock(ctk.CTkFrame):
-    def __init__(self, parent, font: tuple, id: int, remove_func: Callable, width: int, height: int) -> None:
+    def __init__(self, parent, font: tuple, id: int, remove_func: Callable, edit_func: Callable, change_func: Callable, width: int, height: int) -> None:
         super().__init__(parent, width=width, height=height, fg_color="#404040")
 
         self.id = id
         self.font = font
         self.remove_func = remove_func
-        self.editor_obj = None
+        self.edit_func = edit_func
+        self.change_func = change_func
         self.data = {
             "title": "Timer",
             "color": "#ffffff",
@@ -141,8 +163,8 @@ class TimerBlock(ctk.CTkFrame):
             "changes": []
         }
 
-        gear_image = ctk.CTkImage(light_image=Image.open("assets/images/gear.png"), size=(30, 30))
-        X_image = ctk.CTkImage(light_image=Image.open("assets/images/X.png"), size=(30, 30))
+        gear_image = getImage("assets/images/gear.png", (30, 30))
+        X_image = getImage("assets/images/X.png", (30, 30))
 
         self.visible_checkbox = ctk.CTkCheckBox(self, width=20, height=20, text="", border_color="#292929", onvalue=True, offvalue=False, command=self.updateVisibility)
         self.visible_checkbox.place(x=10, rely=0.5, anchor="w")
@@ -156,33 +178,44 @@ class TimerBlock(ctk.CTkFrame):
 
         self.title_label = ctk.CTkLabel(self, text="Timer", font=font, text_color="#ffffff")
         self.title_label.place(x=150, rely=0.5, anchor="w")
+        self.rendered_title = ("Timer", "#ffffff")
 
     def updateVisibility(self) -> None:
         self.data["visible"] = self.visible_checkbox.get()
+        self.change_func()
 
     def remove(self) -> None:
         self.remove_func(self.id)
-        self.pack_forget()
-        self.destroy()
 
     def getData(self) -> dict:
         return self.data
 
     def editTimer(self) -> None:
-        if not self.editor_obj is None:
-            self.editor_obj.cancel()
-            self.editor_obj = None
+        timer_data = self.data
 
         def callback(data):
-            self.data = data
-            self.title_label.configure(text=data["title"], text_color=data["color"])
+            timer_data.clear()
+            timer_data.update(data)
+
+        self.edit_func(self.data, callback)
+
+    def bindRow(self, id: int, data: dict) -> None:
+        self.id = id
 
-        self.editor_obj = Editor(self, self.data, callback, self.font)
+        if not self.data is data:
+            self.setData(data)
 
     def setData(self, data: dict) -> None:
         self.data = data
 
-        self.title_label.configure(text=data["title"], text_color=data["color"])
+        title = (data["title"], data["color"])
+
+        if title != self.rendered_title:
+            self.title_label.configure(text=title[0], text_color=title[1])
+            self.rendered_title = title
+
+        if bool(data["visible"]) == bool(self.visible_checkbox.get()):
+            return
 
         if data["visible"]:
             self.visible_checkbox.select()
@@ -191,10 +224,11 @@ class TimerBlock(ctk.CTkFrame):
 
 
 class TimerScrollableFrame(ctk.CTkScrollableFrame):
-    def __init__(self, parent, width: int, height: int, font: tuple) -> None:
+    def __init__(self, parent, width: int, height: int, font: tuple, on_change: Optional[Callable] = None) -> None:
         super().__init__(parent, width=width, height=height)
 
         self.font = font
+        self.on_change = on_change
         self.width = width
         self.height = height
         self.global_timer_window = None
@@ -204,6 +238,10 @@ class TimerScrollableFrame(ctk.CTkScrollableFrame):
         }
 
         self.timers = []
+        self.row_blocks = {}
+        self.visible_rows = None
+        self.editor = None
+        self.block_pool = WidgetPool(lambda: TimerBlock(self.rows_frame, self.font, 0, self.removeTimer, self.editTimer, self.notifyChange, self.width-10, ROW_HEIGHT), SPARE_ROWS)
 
         half = ( width - 20 ) // 2
 
@@ -216,6 +254,12 @@ class TimerScrollableFrame(ctk.CTkScrollableFrame):
         self.add_timer1.pack(side="left", padx=5)
         self.gt_settings.pack(side="left", padx=5)
 
+        self.rows_frame = ctk.CTkFrame(self, width=width-10, height=1, fg_color="transparent")
+        self.rows_frame.pack()
+
+        self._parent_canvas.configure(yscrollcommand=self._onScroll)
+        self._parent_canvas.bind("<Configure>", lambda event: self.refreshRows(), add="+")
+
     def editGlobalTimer(self) -> None:
         if not self.global_timer_window is None:
             self.global_timer_window.cancel()
@@ -224,46 +268,121 @@ class TimerScrollableFrame(ctk.CTkScrollableFrame):
         def callback(data: dict) -> None:
             self.global_timer_data = data
             self.global_timer_window = None
+            self.notifyChange()
 
         self.global_timer_window = GlobalTimerEditor(self, self.global_timer_data, self.font, callback)
 
-    def addTimer(self) -> None:
-        timer = TimerBlock(self, self.font, len(self.timers), self.removeTimer, self.width-10, 50)
+    def _onScroll(self, first: str, last: str) -> None:
+        self._scrollbar.set(first, last)
+        self.refreshRows()
+
+    def visibleRange(self) -> range:
+        canvas = self._parent_canvas
+        pitch = (ROW_HEIGHT + ROW_PADDING * 2) * self._get_widget_scaling()
+
+        top = canvas.canvasy(0) - self.rows_frame.winfo_y()
+        bottom = top + canvas.winfo_height()
 
-        timer.pack(pady=5)
+        start = max(0, int(top // pitch) - ROW_OVERSCAN)
+        end = min(len(self.timers), int(bottom // pitch) + 1 + ROW_OVERSCAN)
 
-        self.timers.append(timer)
+        return range(start, max(start, end))
+
+    def refreshRows(self, force: bool = False) -> None:
+        rows = self.visibleRange()
+
+        if not force and rows == self.visible_rows:
+            return
+
+        self.visible_rows = rows
+
+        outgoing = [self.row_blocks.pop(index) for index in list(self.row_blocks) if not index in rows]
+
+        for index in rows:
+            block = self.row_blocks.get(index)
+
+            if block is None:
+                block = outgoing.pop() if outgoing else self.block_pool.acquire()
+                block.place(x=0, y=index * (ROW_HEIGHT + ROW_PADDING * 2) + ROW_PADDING)
+                self.row_blocks[index] = block
+
+            block.bindRow(index, self.timers[index])
+
+        for block in outgoing:
+            self.block_pool.release(block)
+
+    def _resizeRows(self) -> None:
+        height = len(self.timers) * (ROW_HEIGHT + ROW_PADDING * 2)
+
+        self.rows_frame.configure(height=max(1, height))
+        self.refreshRows(force=True)
+
+    def notifyChange(self) -> None:
+        if not self.on_change is None:
+            self.on_change()
+
+    def editTimer(self, data: dict, callback: Callable) -> None:
+        def edited(new_data: dict) -> None:
+            callback(new_data)
+
+            # the row may have been rebound to another pooled block while the editor was open
+            for block in self.row_blocks.values():
+                if block.data is data:
+                    block.setData(data)
+
+            self.notifyChange()
+
+        if self.editor is None or not self.editor.winfo_exists():
+            self.editor = Editor(self, data, edited, self.font)
+            return
+
+        self.editor.load(data, edited)
+
+    def addTimer(self) -> None:
+        self.timers.append({
+            "title": "Timer",
+            "color": "#ffffff",
+            "frames": 1024,
+            "visible": True,
+            "changes": []
+        })
+
+        self._resizeRows()
+        self.notifyChange()
 
     def removeTimer(self, id: int) -> None:
         self.timers.pop(id)
 
-        for index, timer in enumerate(self.timers):
-            timer.id = index
+        self._resizeRows()
+        self.notifyChange()
 
     def setTimers(self, data: list[dict]) -> None:
-        for item in self.timers:
-            item.pack_forget()
+        timers = list(data)
+        changed = []
 
-        self.timers = []
+        for index in range(min(len(timers), len(self.timers))):
+            if timers[index] == self.timers[index]:
+                timers[index] = self.timers[index]
+            else:
+                changed.append(index)
 
-        for index, item in enumerate(data):
-            timer = TimerBlock(self, self.font, index, self.removeTimer, self.width-10, 50)
+        resized = len(timers) != len(self.timers)
+        self.timers = timers
 
-            timer.setData(item)
+        for index in changed:
+            block = self.row_blocks.get(index)
 
-            timer.pack(pady=5)
+            if not block is None:
+                block.bindRow(index, timers[index])
 
-            self.timers.append(timer)
+        if resized:
+            self._resizeRows()
 
-    def getTimersData(self) -> list[dict]:
-        data = []
+        if resized or changed:
+            self.notifyChange()
 
-        for timer in self.timers:
-            n = timer.getData()
-
-            data.append(n)
-
-        return data
+    def getTimersData(self) -> list[dict]:
+        return list(self.timers)
 
     def setGlobalTimer(self, data: dict) -> None:
         self.global_timer_data = data
@@ -0,0 +1,48 @@
+from typing import Callable, Any
+
+class WidgetPool:
+    def __init__(self, factory: Callable, max_spare: int = 8) -> None:
+        self.factory = factory
+        self.max_spare = max_spare
+        self.spare = []
+        self.created = 0
+        self.reused = 0
+        self.destroyed = 0
+
+    def acquire(self) -> Any:
+        if self.spare:
+            self.reused += 1
+            return self.spare.pop()
+
+        self.created += 1
+        return self.factory()
+
+    def release(self, widget) -> None:
+        manager = widget.winfo_manager()
+
+        if manager == "pack":
+            widget.pack_forget()
+        elif manager == "place":
+            widget.place_forget()
+
+        if len(self.spare) < self.max_spare:
+            self.spare.append(widget)
+            return
+
+        self.destroyed += 1
+        widget.destroy()
+
+    def clear(self) -> None:
+        for widget in self.spare:
+            widget.destroy()
+
+        self.destroyed += len(self.spare)
+        self.spare = []
+
+    def stats(self) -> dict:
+        return {
+            "spare": len(self.spare),
+            "created": self.created,
+            "reused": self.reused,
+            "destroyed": self.destroyed
+        }